@@ -1,7 +1,37 @@
-# Import other subclasses similarly
-from .anomalies import Anomalies  # noqa: F401
-from .find_treat_duplicates import FindTreatDuplicates  # noqa: F401
-from .memory import Memory  # noqa: F401
-from .qa import QA  # noqa: F401
-from .text_typos import TextTypos  # noqa: F401
-from .treat_na import TreatNA  # noqa: F401
+# Subclasses are imported lazily (PEP 562) so `import CleanData` doesn't pull in
+# transformers or sklearn until the corresponding class is first used.
+from importlib import import_module as _import_module
+
+_subclasses = {
+    'Anomalies': '.anomalies',
+    'CorrectionCache': '.text_typos',
+    'FindTreatDuplicates': '.find_treat_duplicates',
+    'Memory': '.memory',
+    'PersistentCorrectionCache': '.text_typos',
+    'QA': '.qa',
+    'SentinelRegistry': '.treat_na',
+    'StreamingOutliers': '.streaming',
+    'SymSpellIndex': '.symspell',
+    'TextTypos': '.text_typos',
+    'TreatNA': '.treat_na',
+}
+
+_submodules = {module[1:] for module in _subclasses.values()}
+
+__all__ = list(_subclasses)
+
+
+def __getattr__(name: str):
+    if name in _subclasses:
+        value = getattr(_import_module(_subclasses[name], __name__), name)
+    elif name in _submodules:
+        value = _import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the package so __getattr__ is only hit once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _submodules)
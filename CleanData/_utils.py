@@ -1,7 +1,20 @@
+import os
 from functools import wraps
 from time import perf_counter
 from typing import Any, Callable
 
+# Scales the median absolute deviation to the standard deviation of normally distributed values
+_MAD_SCALE = 1.4826
+
+
+def _n_workers(n_jobs: int, limit: int = None) -> int:
+    """Resolve n_jobs like scikit-learn (-1 for every core, -2 for all but one, ...), capped at limit workers."""
+    if n_jobs is None or n_jobs == 0:
+        raise ValueError("Invalid value for n_jobs. Please provide a positive number of workers or -1 for all cores.")
+    if n_jobs < 0:
+        n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+    return max(1, n_jobs if limit is None else min(n_jobs, limit))
+
 
 def get_time(func: Callable) -> Callable:
     @wraps(func)
@@ -14,4 +27,4 @@ def get_time(func: Callable) -> Callable:
         print(f'"{func.__name__}()" took {end_time - start_time:.3f} seconds to execute')
         return result
 
-    return wrapper
\ No newline at end of file
+    return wrapper
@@ -1,17 +1,293 @@
 # Import Dependencies
 import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
-from pyod.models.cd import CD
-from pyod.utils.data import get_outliers_inliers
-from sklearn.neighbors import LocalOutlierFactor
+from sklearn.decomposition import PCA
+from sklearn.neighbors import LocalOutlierFactor, NearestNeighbors
 
-from ._utils import get_time
+from ._utils import _MAD_SCALE, _n_workers, get_time
+from .memory import _chunk_source
+from .streaming import StreamingOutliers
 
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
+# KD-trees lose to ball trees beyond about this many features
+_KD_TREE_MAX_FEATURES = 15
+
+# The approximate search looks for neighbours among this many times k candidates, in this many PCA components
+_APPROX_CANDIDATES = 3
+_APPROX_COMPONENTS = 8
+
+# Rows the PCA of the approximate search is fitted on
+_APPROX_SAMPLE = 10_000
+
+# Number of strata of the default stratified sample (quantiles of the distance to the centre)
+_N_STRATA = 10
+
+# Rows standardised at once when computing the strata
+_STRATA_BLOCK = 1_000_000
+
+# Scales the mean absolute deviation to the standard deviation of normally distributed values
+_MEAN_AD_SCALE = np.sqrt(np.pi / 2)
+
+# Rows of each block of the Cook's distance passes
+_COOKS_BLOCK = 100_000
+
+# Batches in flight per scoring worker, which bounds the memory of the pickled batches
+_BATCHES_PER_WORKER = 2
+
+# The fitted novelty model of a scoring worker, set once by _init_scorer
+_scorer = None
+
+
+def _tree_algorithm(algorithm: str, n_features: int) -> str:
+    """Resolve 'auto' to a KD-tree for a few features & to a ball tree beyond."""
+    if algorithm == 'auto':
+        return 'kd_tree' if n_features <= _KD_TREE_MAX_FEATURES else 'ball_tree'
+    return algorithm
+
+
+def _kneighbors(X: np.ndarray, k: int, algorithm: str = 'auto', block_size: int = 4096, random_state: int = 0,
+                n_jobs: int = None) -> tuple:
+    """k nearest neighbours of every row of X (the row itself excluded), queried block by block.
+
+    Returns:
+        (np.ndarray, np.ndarray): The (n, k) float32 distances & int32 indices of the neighbours, closest first
+    """
+    n, p = X.shape
+    algorithm = _tree_algorithm(algorithm, p)
+    approximate = algorithm == 'approximate' and p > _APPROX_COMPONENTS
+    if approximate:
+        # Candidates are searched in a few principal components, then re-ranked on their exact distances
+        rows = np.random.default_rng(random_state).choice(n, min(n, _APPROX_SAMPLE), replace=False)
+        space = PCA(n_components=_APPROX_COMPONENTS, random_state=random_state).fit(X[rows]).transform(X)
+        n_candidates, algorithm = min(n, _APPROX_CANDIDATES * (k + 1)), 'kd_tree'
+    else:
+        space, n_candidates = X, k + 1
+        algorithm = 'kd_tree' if algorithm == 'approximate' else algorithm
+    tree = NearestNeighbors(n_neighbors=n_candidates, algorithm=algorithm, n_jobs=n_jobs).fit(space)
+
+    distances = np.empty((n, k), dtype=np.float32)
+    indices = np.empty((n, k), dtype=np.int32 if n < 2 ** 31 else np.int64)
+    for start in range(0, n, block_size):
+        rows = np.arange(start, min(start + block_size, n))
+        dist, ind = tree.kneighbors(space[rows], n_neighbors=n_candidates)
+        if approximate:
+            dist = np.sqrt(((X[ind] - X[rows, None, :]) ** 2).sum(axis=-1))
+            order = np.argsort(dist, axis=1, kind='stable')
+            dist, ind = np.take_along_axis(dist, order, axis=1), np.take_along_axis(ind, order, axis=1)
+        # Each row is dropped from its own neighbours (or the furthest candidate, when duplicates come first)
+        keep = ind != rows[:, None]
+        keep &= np.cumsum(keep, axis=1) <= k
+        distances[rows], indices[rows] = dist[keep].reshape(-1, k), ind[keep].reshape(-1, k)
+    return distances, indices
+
+
+def _local_outlier_factors(distances: np.ndarray, indices: np.ndarray, block_size: int = 4096) -> np.ndarray:
+    """Local outlier factor of every row from its k nearest neighbours, like LocalOutlierFactor, block by block."""
+    n = len(distances)
+    k_distances = distances[:, -1]
+    lrd = np.empty(n)
+    for start in range(0, n, block_size):
+        block = slice(start, start + block_size)
+        reach = np.maximum(distances[block], k_distances[indices[block]])
+        lrd[block] = 1.0 / (reach.mean(axis=1, dtype=np.float64) + 1e-10)
+    factors = np.empty(n)
+    for start in range(0, n, block_size):
+        block = slice(start, start + block_size)
+        factors[block] = lrd[indices[block]].mean(axis=1) / lrd[block]
+    return factors
+
+
+def _lof_outliers(factors: np.ndarray, contamination) -> np.ndarray:
+    """Outlier mask from the local outlier factors, with LocalOutlierFactor's threshold."""
+    if contamination == 'auto':
+        return factors > 1.5
+    return -factors < np.percentile(-factors, 100.0 * contamination)
+
+
+def _scalable_lof(X: np.ndarray, k: int, contamination, algorithm: str = 'auto', block_size: int = 4096,
+                  random_state: int = 0, n_jobs: int = None) -> np.ndarray:
+    """Outlier mask of the rows of X from a blockwise LOF on a k-nearest neighbour tree search."""
+    distances, indices = _kneighbors(X, k, algorithm, block_size, random_state, n_jobs)
+    return _lof_outliers(_local_outlier_factors(distances, indices, block_size), contamination)
+
+
+def _lof_recall(X: np.ndarray, k: int, contamination, algorithm: str = 'auto', block_size: int = 4096,
+                sample_size: int = 5000, random_state: int = 0, n_jobs: int = None) -> float:
+    """Fraction of the outliers of an exact (brute force) LocalOutlierFactor found by _scalable_lof, on a sample of rows."""
+    rows = np.random.default_rng(random_state).choice(len(X), min(len(X), sample_size), replace=False)
+    sample = X[np.sort(rows)]
+    k = max(1, min(k, len(sample) - 1))
+    exact = LocalOutlierFactor(n_neighbors=k, algorithm='brute', contamination=contamination).fit_predict(sample) == -1
+    if not exact.any():
+        return 1.0
+    found = _scalable_lof(sample, k, contamination, algorithm, block_size, random_state, n_jobs)
+    return float((found & exact).sum() / exact.sum())
+
+
+
+def _stratified_sample(X: pd.DataFrame, size: int, strata: np.ndarray = None, random_state: int = 0) -> np.ndarray:
+    """Sorted positions of a sample of rows drawn from every stratum in proportion to its size (one row at least).
+
+    Without strata, the rows are stratified on the deciles of their
+    standardised distance to the centre, so the tails of the distribution
+    are as represented in the sample as in the data. The frame is only
+    converted to float64 a block of rows at a time.
+    """
+    n = len(X)
+    if size >= n:
+        return np.arange(n)
+    rng = np.random.default_rng(random_state)
+    if strata is None:
+        centre, scale = X.mean().to_numpy(dtype=np.float64), X.std(ddof=0).to_numpy(dtype=np.float64, copy=True)
+        scale[scale == 0] = 1
+        distances = np.empty(n, dtype=np.float32)
+        for start in range(0, n, _STRATA_BLOCK):
+            block = X.iloc[start:start + _STRATA_BLOCK].to_numpy(dtype=np.float64, na_value=np.nan)
+            distances[start:start + _STRATA_BLOCK] = np.sqrt(np.square((block - centre) / scale).sum(axis=1))
+        edges = np.unique(np.nanquantile(distances, np.linspace(0, 1, _N_STRATA + 1)[1:-1]))
+        strata = np.searchsorted(edges, distances)
+
+    codes, _ = pd.factorize(strata, use_na_sentinel=False)
+    counts = np.bincount(codes)
+    allocation = np.maximum(np.round(counts * size / n).astype(np.int64), 1)
+    order = np.argsort(codes, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rows = [rng.choice(order[start:start + count], min(take, count), replace=False)
+            for start, count, take in zip(starts, counts, allocation)]
+    return np.sort(np.concatenate(rows))
+
+
+def _three_sigma_rates(X: np.ndarray, center_measure: str = 'mean') -> tuple:
+    """Fraction of the rows of every feature more than 3 spreads away from its centre.
+
+    The centres & spreads of all the features are computed at once on the
+    float32 matrix: mean & standard deviation, or median & scaled median
+    absolute deviation (robust to the outliers being counted). Features
+    whose MAD is 0 (binary or heavily tied ones) fall back to the scaled
+    mean absolute deviation from the median, otherwise every value off the
+    median would be counted. Missing values are ignored, but still count as rows.
+
+    Returns:
+        (float, np.ndarray): The contamination (median of the rates) & the rate of every feature
+    """
+    if center_measure == 'mean':
+        centers = np.nanmean(X, axis=0, dtype=np.float64)
+        spreads = np.nanstd(X, axis=0, dtype=np.float64, ddof=1)
+    elif center_measure == 'median':
+        centers = np.nanmedian(X, axis=0)
+        deviations = np.abs(X - centers.astype(X.dtype))
+        spreads = _MAD_SCALE * np.nanmedian(deviations, axis=0)
+        tied = spreads == 0
+        if tied.any():
+            spreads[tied] = _MEAN_AD_SCALE * np.nanmean(deviations[:, tied], axis=0, dtype=np.float64)
+    else:
+        raise ValueError("Invalid value for center_measure. Please provide 'mean' or 'median'.")
+
+    # Counted block by block, so no (n, p) boolean mask is held at once
+    centers, limits = centers.astype(X.dtype), (3 * spreads).astype(X.dtype)
+    counts = np.zeros(X.shape[1], dtype=np.int64)
+    for start in range(0, len(X), _STRATA_BLOCK):
+        counts += (np.abs(X[start:start + _STRATA_BLOCK] - centers) > limits).sum(axis=0)
+    rates = counts / len(X) if len(X) else counts.astype(np.float64)
+    return float(np.median(rates)), rates
+
+
+def _cooks_distances(X: np.ndarray, block_size: int = _COOKS_BLOCK) -> np.ndarray:
+    """Mean Cook's distance of every row over the regressions of each feature on the others (with an intercept).
+
+    A single eigendecomposition of the centred Gram matrix (the SVD of the
+    centred features) gives every regression at once: with G+ its
+    pseudo-inverse and B = Xc @ G+, the residuals of feature j are
+    B[:, j] / G+[j, j], its residual sum of squares 1 / G+[j, j] and the
+    leverages of its regression 1 / n + rowsum((Xc @ V / s) ** 2) - B[:, j] ** 2 / G+[j, j].
+    The rows are processed block by block, so no n x n hat matrix (nor any
+    n x p copy of the data) is formed. Rows with missing values get NaN.
+    """
+    n, p = X.shape
+    complete = np.empty(n, dtype=bool)
+    total = np.zeros(p)
+    for start in range(0, n, block_size):
+        block = X[start:start + block_size]
+        complete[start:start + block_size] = ~np.isnan(block).any(axis=1)
+        total += block[complete[start:start + block_size]].sum(axis=0, dtype=np.float64)
+    m = int(complete.sum())
+    mean = total / max(m, 1)
+
+    # Centred Gram matrix accumulated in float64 (even for float32 data), then its eigendecomposition
+    gram = np.zeros((p, p))
+    for start in range(0, n, block_size):
+        centred = X[start:start + block_size][complete[start:start + block_size]].astype(np.float64) - mean
+        gram += centred.T @ centred
+    eigenvalues, eigenvectors = np.linalg.eigh(gram)
+    kept = eigenvalues > max(eigenvalues.max(initial=0), 0) * p * np.finfo(np.float64).eps
+    rank = int(kept.sum())
+    whitening = eigenvectors[:, kept] / np.sqrt(eigenvalues[kept])
+    pseudo_inverse = whitening @ whitening.T
+    diagonal = np.diag(pseudo_inverse).copy()
+
+    # Every regression has an intercept & rank - 1 independent features, constant (or redundant) features are skipped
+    regressions = diagonal > 0
+    n_params, dof = rank, m - rank
+    distances = np.full(n, np.nan)
+    if not regressions.any() or dof <= 0:
+        return distances
+    mse = 1.0 / diagonal[regressions] / dof
+    for start in range(0, n, block_size):
+        rows = np.flatnonzero(complete[start:start + block_size]) + start
+        centred = X[rows].astype(np.float64) - mean
+        leverage = 1.0 / m + np.square(centred @ whitening).sum(axis=1)
+        B = (centred @ pseudo_inverse)[:, regressions]
+        residuals = B / diagonal[regressions]
+        leverages = np.clip(leverage[:, None] - np.square(B) / diagonal[regressions], 0, 1 - 1e-12)
+        cooks = np.square(residuals) / (n_params * mse) * leverages / np.square(1 - leverages)
+        distances[rows] = cooks.mean(axis=1)
+    return distances
+
+
+def _batch(X: pd.DataFrame, start: int, batch_size: int) -> np.ndarray:
+    """Float64 rows [start, start + batch_size) of a frame."""
+    return X.iloc[start:start + batch_size].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _init_scorer(model: LocalOutlierFactor) -> None:
+    """Process pool initializer: receive the fitted novelty model once, before the first batch."""
+    global _scorer
+    _scorer = model
+
+
+def _score_batch(X: np.ndarray) -> np.ndarray:
+    """Outlier mask of a batch of rows, scored by the worker's novelty model."""
+    return _scorer.predict(X) == -1
+
+
+def _score_novelty(model: LocalOutlierFactor, X: pd.DataFrame, batch_size: int = 100_000, n_jobs: int = 1) -> np.ndarray:
+    """Outlier mask of every row of X scored in batches against a novelty model, serially or across a process pool.
+
+    Each batch is converted to float64 on its own, so the frame is never copied as a whole.
+    """
+    n_workers = _n_workers(n_jobs, -(-len(X) // batch_size))
+    is_outlier = np.empty(len(X), dtype=bool)
+    if n_workers == 1:
+        for start in range(0, len(X), batch_size):
+            is_outlier[start:start + batch_size] = model.predict(_batch(X, start, batch_size)) == -1
+        return is_outlier
+
+    # A bounded window of batches is in flight, so the pickled batches never hold a copy of the whole dataset
+    with ProcessPoolExecutor(n_workers, initializer=_init_scorer, initargs=(model,)) as pool:
+        pending, starts = {}, iter(range(0, len(X), batch_size))
+        for start in starts:
+            pending[start] = pool.submit(_score_batch, _batch(X, start, batch_size))
+            if len(pending) >= n_workers * _BATCHES_PER_WORKER:
+                first = min(pending)
+                is_outlier[first:first + batch_size] = pending.pop(first).result()
+        for start, future in pending.items():
+            is_outlier[start:start + batch_size] = future.result()
+    return is_outlier
 
 
 #!############################# # Find & Treat Anomalies # ##############################
@@ -125,18 +401,49 @@ class Anomalies:
     #* (2) Method
     @classmethod
     @get_time
-    def nonlinear_outliers_influencers_knn(cls, data: pd.DataFrame, features: list, neighbors_fraction: float = 0.1, contamination='auto', center_measure='mean'):
+    def nonlinear_outliers_influencers_knn(cls, data: pd.DataFrame, features: list, neighbors_fraction: float = 0.1, contamination='auto', center_measure='mean', method='exact', n_neighbors: int = None, max_neighbors: int = 50, algorithm='auto', block_size: int = 4096, recall_sample: int = 5000, reference: pd.DataFrame = None, sample_size: int = 100_000, stratify=None, batch_size: int = 100_000, random_state: int = 0, n_jobs: int = None, return_report=False):
         """Detects outliers in a dataset based on nonlinear methods and KNN.
 
+        method='exact' fits LocalOutlierFactor with len(data) * neighbors_fraction
+        neighbours, which is quadratic in the number of rows. method='scalable'
+        caps the neighbourhood at max_neighbors, finds the neighbours with a
+        KD/ball tree (or an approximate search in a few principal components,
+        re-ranked on exact distances) queried block by block, and computes the
+        local outlier factors block by block: memory holds the n x k neighbour
+        distances & indices instead of growing with n * len(data) * neighbors_fraction.
+        The recall of the scalable outliers against an exact LocalOutlierFactor
+        is measured on a sample of rows.
+
+        method='novelty' fits LocalOutlierFactor(novelty=True) once, on a
+        stratified sample of sample_size rows of a reference dataset (data
+        itself by default), and then scores every row of data against it in
+        batches of batch_size rows spread across n_jobs processes: memory &
+        fitting time are bounded by the sample, scoring is embarrassingly
+        parallel.
+
         Parameters:
             - data (pd.DataFrame): The dataset to analyze.
             - features (list): List of features to consider for outlier detection.
             - neighbors_fraction (float, optional): Fraction of dataset size to use as neighbors. Defaults to 0.1.
             - contamination (str, optional): Method for calculating contamination ('auto', '3std'). Defaults to 'auto'.
-            - center_measure (str, optional): Central distribution measure to use ('mean' or 'median'). Defaults to 'mean'.
+            - center_measure (str, optional): Central distribution measure of the '3std' contamination ('mean' with the standard deviation, or 'median' with the scaled median absolute deviation). Defaults to 'mean'.
+            - method (str, optional): 'exact' (LocalOutlierFactor), 'scalable' (capped k, tree search & blockwise LOF) or 'novelty' (fit on a stratified sample, score in batches). Defaults to 'exact'.
+            - n_neighbors (int, optional): Number of neighbors, overriding neighbors_fraction. Defaults to None.
+            - max_neighbors (int, optional): Cap on the number of neighbors with method='scalable' or 'novelty' (the LOF paper suggests 10 to 50). Defaults to 50.
+            - algorithm (str, optional): Neighbour search with method='scalable' or 'novelty' ('auto', 'kd_tree', 'ball_tree' or 'approximate', which is 'auto' for 'novelty'), 'auto' picks a KD-tree up to 15 features & a ball tree beyond. Defaults to 'auto'.
+            - block_size (int, optional): Rows queried & scored at once with method='scalable'. Defaults to 4096.
+            - recall_sample (int, optional): Rows of the sample the scalable outliers are compared to an exact LocalOutlierFactor on, 0 or None to skip it. Defaults to 5000.
+            - reference (pd.DataFrame, optional): Reference distribution (with the features) the novelty model is fitted on. Defaults to None (data).
+            - sample_size (int, optional): Rows of the reference the novelty model is fitted on. Defaults to 100_000.
+            - stratify (str or list, optional): Column(s) of the reference the novelty sample is stratified on. Defaults to None (deciles of the standardised distance to the centre).
+            - batch_size (int, optional): Rows scored at once by the novelty model. Defaults to 100_000.
+            - random_state (int, optional): Seed of the recall & novelty samples and of the approximate search. Defaults to 0.
+            - n_jobs (int, optional): Number of threads the neighbour queries run on, or of processes the batches are scored across with method='novelty', -1 for all cores. Defaults to None (1).
+            - return_report (bool, optional): Whether to also return a report of the detection. Defaults to False.
 
         Returns:
             pd.DataFrame: DataFrame of outliers.
+            (pd.DataFrame, dict): When return_report=True, the outliers & a report with the 'method', 'n_neighbors', 'contamination' (with the '3std' 'feature_rates'), for method='scalable', the 'algorithm' & the 'recall' of the exact outliers on the sample, for method='novelty', the 'algorithm', 'sample_size' & number of 'batches'
         
         Example usage:
         --------------
@@ -169,89 +476,86 @@ class Anomalies:
 
             # Identify outliers influencers from your dataset
             CleanData.anomalies.Anomalies.nonlinear_outliers_influencers_knn(df, df.columns.to_list())
-        """    
-        
-        if contamination == 'auto': 
-            # Start the timer
-            start_time = time.time()
-            
-            # Calculate the number of neighbors based on a fraction of the dataset size
-            n_neighbors = max(1, int(len(data) * neighbors_fraction))
 
-            # Use Local Outlier Factor for outlier detection (contamination auto = 0.1)
-            clf = LocalOutlierFactor(n_neighbors=n_neighbors, contamination='auto')
-            X = data[features]
-            # Fit the model and predict outliers (-1 for outliers, 1 for inliers)
-            y_pred = clf.fit_predict(X)
-            
-            # Filter outliers
-            X['outlier'] = y_pred
-            outliers = X[X['outlier'] == -1]
-            
-            # End the timer
-            end_time = time.time()
-            # Calculate the elapsed time
-            elapsed_time = end_time - start_time
-            
-            # Convert elapsed time to milliseconds
-            elapsed_time_ms = elapsed_time * 1000
+            # Scale to millions of rows: at most 50 neighbours & a tree search
+            CleanData.anomalies.Anomalies.nonlinear_outliers_influencers_knn(df, df.columns.to_list(), method='scalable')
 
-            # Print the elapsed time in milliseconds
-            print("Elapsed time:", elapsed_time_ms, "milliseconds")
-            print("n_nighbors:", n_neighbors)
-            return outliers.drop('outlier', axis=1)
-        
-        elif contamination == '3std':
-            # Start the timer
-            start_time = time.time()
-            
-            # Calculate the mean and standard deviation of features
-            if center_measure == 'mean':
-                centers = data[features].mean().values
-                spreads = data[features].std().values
-            elif center_measure == 'median':
-                centers = data[features].median().values
-                spreads = data[features].std().values  
-                    
-            # Calculate contamination -> return 3 STD from the mean +/-
-            contamination_values = []
-            for i, spread in enumerate(spreads):
-                if center_measure == 'mean':
-                    outlier_mask = (data.iloc[:, i] < centers[i] - 3 * spread) | (data.iloc[:, i] > centers[i] + 3 * spread)
-                elif center_measure == 'median':
-                    outlier_mask = (data.iloc[:, i] < centers[i] - 3 * spread) | (data.iloc[:, i] > centers[i] + 3 * spread)
-                contamination_values.append(data[outlier_mask].shape[0] / data.shape[0])
-                    
-            # Return contamination
-            contamination = np.median(contamination_values)
-            
-            # Calculate the number of neighbors based on a fraction of the dataset size
-            n_neighbors = max(1, int(len(data) * neighbors_fraction))
+            # Score new rows against a sample of a reference distribution, across 4 processes
+            new_df = pd.DataFrame(np.random.rand(200, n_features) * 1.5, columns=df.columns)
+            CleanData.anomalies.Anomalies.nonlinear_outliers_influencers_knn(new_df, df.columns.to_list(), method='novelty', reference=df, sample_size=500, n_jobs=4)
+        """    
+        if method not in ('exact', 'scalable', 'novelty'):
+            raise ValueError("Invalid value for method. Please provide 'exact', 'scalable' or 'novelty'.")
+        if algorithm not in ('auto', 'kd_tree', 'ball_tree', 'approximate'):
+            raise ValueError("Invalid value for algorithm. Please provide 'auto', 'kd_tree', 'ball_tree' or 'approximate'.")
+
+        # Start the timer
+        start_time = time.time()
+
+        # The novelty model is fitted (& its contamination estimated) on the reference rows
+        fit_data = data if method != 'novelty' or reference is None else reference
+        feature_rates = None
+        if contamination == '3std':
+            # Contamination -> median of the features' rates of values 3 spreads away from the center +/-
+            contamination, feature_rates = _three_sigma_rates(fit_data[features].to_numpy(dtype=np.float32), center_measure)
+        elif contamination != 'auto':
+            raise ValueError("Invalid value for contamination. Please provide 'auto' or '3std'.")
 
-            # Use Local Outlier Factor for outlier detection (contamination auto = 3 STD away from the mean +/-) 
-            clf = LocalOutlierFactor(n_neighbors=n_neighbors, contamination=contamination)
-            X = data[features]
-            # Fit the model and predict outliers (-1 for outliers, 1 for inliers)
-            y_pred = clf.fit_predict(X)
-            
-            # Filter outliers
-            X['outlier'] = y_pred
-            outliers = X[X['outlier'] == -1]
-            
-            # End the timer
-            end_time = time.time()
-            # Calculate the elapsed time
-            elapsed_time = end_time - start_time
-            
-            # Convert elapsed time to milliseconds
-            elapsed_time_ms = elapsed_time * 1000
+        # Calculate the number of neighbors based on a fraction of the dataset (or novelty sample) size
+        n_fit = len(data) if method != 'novelty' else min(len(fit_data), sample_size)
+        if n_neighbors is None:
+            n_neighbors = max(1, int(n_fit * neighbors_fraction))
+        if method != 'exact':
+            n_neighbors = min(n_neighbors, max_neighbors)
+        n_neighbors = max(1, min(n_neighbors, n_fit - 1))
+        report = {'method': method, 'n_neighbors': n_neighbors, 'contamination': contamination}
+        if feature_rates is not None:
+            report['feature_rates'] = dict(zip(features, feature_rates.tolist()))
 
-            # Print the elapsed time in milliseconds
-            print("Elapsed time:", elapsed_time_ms, "milliseconds")
-            print("n_nighbors:", n_neighbors)
-            return outliers.drop('outlier', axis=1)
+        X = data[features]
+        if contamination == 0:
+            # No feature has values 3 spreads away from its centre, LocalOutlierFactor has nothing to flag
+            is_outlier = np.zeros(len(X), dtype=bool)
+        elif method == 'exact':
+            # Use Local Outlier Factor for outlier detection (contamination auto = 0.1 or 3 STD away from the center +/-)
+            clf = LocalOutlierFactor(n_neighbors=n_neighbors, contamination=contamination, n_jobs=n_jobs)
+            # Fit the model and predict outliers (-1 for outliers, 1 for inliers)
+            is_outlier = clf.fit_predict(X) == -1
+        elif method == 'novelty':
+            # Fit on a stratified sample of the reference, then score every row in batches
+            strata = None if stratify is None else fit_data.groupby(stratify, sort=False, dropna=False).ngroup().to_numpy()
+            rows = _stratified_sample(fit_data[features], sample_size, strata, random_state)
+            n_neighbors = report['n_neighbors'] = max(1, min(n_neighbors, len(rows) - 1))
+            tree = _tree_algorithm('auto' if algorithm == 'approximate' else algorithm, len(features))
+            clf = LocalOutlierFactor(n_neighbors=n_neighbors, contamination=contamination, novelty=True, algorithm=tree)
+            # Only the sampled reference rows are converted to float64, the data is converted batch by batch
+            clf.fit(fit_data[features].iloc[rows].to_numpy(dtype=np.float64, na_value=np.nan))
+            is_outlier = _score_novelty(clf, X, batch_size, n_jobs or 1)
+            report.update(algorithm=tree, sample_size=len(rows), batches=-(-len(X) // batch_size))
         else:
-            raise ValueError("Invalid value for contamination. Please provide 'auto' or '3std'.")
+            X_array = X.to_numpy(dtype=np.float64)
+            is_outlier = _scalable_lof(X_array, n_neighbors, contamination, algorithm, block_size, random_state, n_jobs)
+            report['algorithm'] = algorithm
+            if recall_sample:
+                report['recall'] = _lof_recall(X_array, n_neighbors, contamination, algorithm, block_size, recall_sample,
+                                               random_state, n_jobs)
+                print(f"Recall against exact LOF on {min(len(X), recall_sample):,} rows: {report['recall']:.1%}")
+
+        # Filter outliers
+        outliers = X[is_outlier]
+
+        # End the timer
+        end_time = time.time()
+        # Calculate the elapsed time
+        elapsed_time = end_time - start_time
+        
+        # Convert elapsed time to milliseconds
+        elapsed_time_ms = elapsed_time * 1000
+
+        # Print the elapsed time in milliseconds
+        print("Elapsed time:", elapsed_time_ms, "milliseconds")
+        print("n_neighbors:", n_neighbors)
+        return (outliers, report) if return_report else outliers
 
     
     
@@ -263,16 +567,29 @@ class Anomalies:
     #* (3) Method
     @classmethod
     @get_time
-    def linear_outliers_influencers(cls,data:pd.DataFrame ,features:list, center_measure='mean'):
+    def linear_outliers_influencers(cls, data: pd.DataFrame, features: list, center_measure='mean', block_size: int = 100_000, dtype=None, return_distances=False):
         """This function align for linear datasets to explore outliers using Cook's D (distance based evaluation). A Cook’s result > 1 = Significant influence, while Cook’s D > 0.5 is worth investigating. 
 
+        Each feature is regressed on the others (with an intercept) and the
+        Cook's distances of a row are averaged over these regressions. All the
+        regressions come from a single eigendecomposition of the p x p Gram
+        matrix of the centred features: the leverages (the hat diagonals) and
+        residuals are computed block by block, without forming the n x n hat
+        matrix, so memory stays O(n * p). The rows whose distance is above the
+        (1 - contamination) quantile are the outliers, the contamination being
+        estimated with 3 spreads from the center.
+
         Parameters:
             - data (pd.DataFrame): The dataset to analyze.
             - features (list): List of features to consider for outlier detection.
-            - center_measure (str, optional): Central distribution measure to use ('mean' or 'median'). Defaults to 'mean'.
+            - center_measure (str, optional): Central distribution measure of the '3std' contamination ('mean' with the standard deviation, or 'median' with the scaled median absolute deviation). Defaults to 'mean'.
+            - block_size (int, optional): Rows processed at once. Defaults to 100_000.
+            - dtype (optional): Dtype of the feature matrix, 'float32' halves its memory (sums are still accumulated in float64). Defaults to None (float32 when every feature is float32, float64 otherwise).
+            - return_distances (bool, optional): Whether to also return the Cook's distance of every row. Defaults to False.
 
         Returns:
             pd.DataFrame: DataFrame of outliers.
+            (pd.DataFrame, pd.Series): When return_distances=True, the outliers & the Cook's distances aligned to the index of data (NaN for rows with missing values)
         
         Example usage:
         --------------
@@ -303,47 +620,81 @@ class Anomalies:
 
             # Identify outliers influencers from your dataset
             CleanData.anomalies.Anomalies.linear_outliers_influencers(df, df.columns.to_list())
+
+            # Keep the Cook's distance of every row, aligned to the index of df
+            outliers, distances = CleanData.anomalies.Anomalies.linear_outliers_influencers(df, df.columns.to_list(), return_distances=True)
+            distances[distances > 0.5]
         """            
-        
-        # Calculate the mean and standard deviation of features
-        if center_measure == 'mean':
-            centers = data[features].mean().values
-            spreads = data[features].std().values
-        elif center_measure == 'median':
-            centers = data[features].median().values
-            spreads = data[features].std().values  
-                    
-        # Calculate contamination -> return 3 STD from the mean +/-
-        contamination_values = []
-        for i, spread in enumerate(spreads):
-            if center_measure == 'mean':
-                outlier_mask = (data.iloc[:, i] < centers[i] - 3 * spread) | (data.iloc[:, i] > centers[i] + 3 * spread)
-            elif center_measure == 'median':
-                outlier_mask = (data.iloc[:, i] < centers[i] - 3 * spread) | (data.iloc[:, i] > centers[i] + 3 * spread)
-            contamination_values.append(data[outlier_mask].shape[0] / data.shape[0])
-                    
-        # Return contamination
-        contamination = np.median(contamination_values)
-
-        # Splitting to X & Y columns
-        X = data[features]
+        if dtype is None:
+            dtype = np.float32 if all(data[feature].dtype == np.float32 for feature in features) else np.float64
+        X = data[features].to_numpy(dtype=dtype, na_value=np.nan)
 
-        # Instantiate the Cook's D evaluator
-        cooks_D = CD(contamination=contamination)
-        # predict outliers
-        cooks_D.fit(X)
+        # Contamination -> median of the features' rates of values 3 spreads away from the center +/-
+        contamination, _ = _three_sigma_rates(X.astype(np.float32, copy=False), center_measure)
 
-        # predict outliers & inliners (bool array = 1/0)
-        pred = cooks_D.predict(X, return_confidence=True)
-        # We have to transpose the dataset to match the dataset
-        df = pd.DataFrame(pred).T
-        df = df.rename(columns={0: "predictions", 1: "confidence"})
+        # Cook's distances & the rows above the (1 - contamination) quantile
+        distances = pd.Series(_cooks_distances(X, block_size), index=data.index, name='cooks_distance')
+        threshold = np.nanpercentile(distances, 100 * (1 - contamination)) if distances.notna().any() else np.inf
+        outliers = data.loc[(distances > threshold).to_numpy(), features]
+        return (outliers, distances) if return_distances else outliers
 
-        X_array = X.to_numpy() # Transforming to numpy array to leverage get_outliers_inliers
-        y_array = df["predictions"]   
-            
-        # Extracting inliners and outliers
-        X_outliers, X_inliners = get_outliers_inliers(X_array, y_array)
+    
+    
+    
+    
+    
+    
+    
+    #* (4) Method
+    @classmethod
+    @get_time
+    def univariate_outliers_chunked(cls, source, features: list = None, method='zscore', threshold: float = None, chunksize: int = 100_000, k: int = 200, n_jobs: int = 1, return_report=False, **read_kwargs) -> pd.DataFrame:
+        """Detects univariate outliers (z-score, MAD or IQR) of data read in chunks, in constant memory per column.
+
+        The data is read twice, one chunk at a time:
+            1. The first pass sketches every column (Welford moments & a KLL quantile sketch), the chunks being sketched across n_jobs processes and the partial states merged.
+            2. The second pass flags the values of every chunk outside the bounds learned from the whole data.
+
+        Parameters:
+            - source (str | os.PathLike | callable | list): Path to a .csv or .parquet file, a callable returning an iterable of DataFrame chunks, or a list of DataFrame chunks.
+            - features (list, optional): List of features to consider for outlier detection. Defaults to None (the numeric columns).
+            - method (str, optional): 'zscore' (mean & standard deviation), 'mad' (median & scaled median absolute deviation) or 'iqr' (quartiles & interquartile range). Defaults to 'zscore'.
+            - threshold (float, optional): Number of standard deviations, scaled MADs or IQRs beyond which a value is an outlier. Defaults to None (3, 3 & 1.5).
+            - chunksize (int, optional): Number of rows per chunk when reading a file. Defaults to 100_000.
+            - k (int, optional): Size of the quantile sketches (rank error of about 1.7 / k). Defaults to 200.
+            - n_jobs (int, optional): Number of processes the chunks of the first pass are sketched across, -1 for all cores. Defaults to 1.
+            - return_report (bool, optional): Whether to also return the per-column statistics, bounds & number of outliers. Defaults to False.
+            - **read_kwargs: Extra keyword arguments passed to pd.read_csv / pyarrow ParquetFile.iter_batches.
+
+        Returns:
+            pd.DataFrame: DataFrame of the rows with at least one outlier value.
+            (pd.DataFrame, pd.DataFrame): When return_report=True, the outliers & a report indexed by column with the statistics, 'lower' & 'upper' bounds and number of 'outliers'
+
+        Example usage:
+        --------------
+        .. code-block:: python
+
+            # Import dependencies
+            import CleanData
 
-        # Result outliers
-        return pd.DataFrame(X_outliers, columns=X.columns)
\ No newline at end of file
+            # Rows of a file too large for memory with a value 3 scaled MADs away from its column's median
+            outliers, report = CleanData.Anomalies.univariate_outliers_chunked('transactions.csv', ['amount', 'duration'], method='mad', chunksize=500_000, n_jobs=4, return_report=True)
+        """
+        # First pass: mergeable sketches of every column
+        detector = StreamingOutliers(features, method, threshold, k)
+        detector.fit(_chunk_source(source, chunksize, **read_kwargs)(), n_jobs)
+        bounds = detector.bounds()
+
+        # Second pass: flag the rows against the bounds of the whole data
+        outliers, counts = [], np.zeros(len(detector.features), dtype=np.int64)
+        for chunk in _chunk_source(source, chunksize, **read_kwargs)():
+            flags = detector.flag(chunk, bounds)
+            counts += flags.sum(axis=0).to_numpy()
+            outliers.append(chunk[flags.any(axis=1).to_numpy()])
+        outliers = pd.concat(outliers) if outliers else pd.DataFrame(columns=detector.features)
+
+        if return_report:
+            report = detector.stats().join(bounds)
+            report['outliers'] = counts
+            return outliers, report
+        return outliers
\ No newline at end of file
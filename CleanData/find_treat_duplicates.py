@@ -1,9 +1,256 @@
 # Import Dependencies
+import os
+
+import numpy as np
 import pandas as pd
 
 
 from ._utils import get_time
 
+
+def _row_hashes(data: pd.DataFrame) -> np.ndarray:
+    """Combine the columns of a DataFrame into one 64-bit hash per row, one column at a time.
+
+    Numeric columns are hashed directly; other columns (object, strings, categories, ...) are hashed
+    through their factorized codes, which is much cheaper than hashing every string and is enough
+    to compare rows within this DataFrame (the hashes aren't comparable across DataFrames).
+    """
+    hashes = np.zeros(len(data), dtype=np.uint64)
+    for _, values in data.items():
+        if pd.api.types.is_float_dtype(values) and not isinstance(values.dtype, pd.api.extensions.ExtensionDtype):
+            # Canonical bits for -0.0 & NaN, which duplicated() treats as equal to 0.0 & NaN
+            arr = values.to_numpy() + 0.0
+            arr[np.isnan(arr)] = np.nan
+            column = pd.util.hash_array(arr)
+        elif pd.api.types.is_numeric_dtype(values) and not isinstance(values.dtype, pd.api.extensions.ExtensionDtype):
+            column = pd.util.hash_array(values.to_numpy())
+        else:
+            column = pd.util.hash_array(pd.factorize(values)[0])
+        hashes = (hashes * np.uint64(0x100000001B3)) ^ column
+    return hashes
+
+
+def _select(data: pd.DataFrame, subset=None) -> pd.DataFrame:
+    if subset is None:
+        return data
+    return data[[subset]] if np.isscalar(subset) else data[list(subset)]
+
+
+def _stable_row_hashes(data: pd.DataFrame) -> np.ndarray:
+    """One 64-bit hash per row computed from the values only, so rows of different chunks can be compared.
+
+    Numbers are hashed through a canonical 64-bit pattern so 1 (int) & 1.0 (float) match: a chunk read
+    as int and another read as float (because of a NaN) still hash identically.
+    """
+    hashes = np.zeros(len(data), dtype=np.uint64)
+    for _, values in data.items():
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            arr = values.to_numpy(dtype=np.float64, na_value=np.nan) if pd.api.types.is_float_dtype(values) or \
+                isinstance(values.dtype, pd.api.extensions.ExtensionDtype) else values.to_numpy()
+            if arr.dtype.kind == "f":
+                integral = np.isfinite(arr) & (arr == np.trunc(arr)) & (np.abs(arr) < 2.0 ** 63)
+                bits = (arr + 0.0).view(np.uint64).copy()  # + 0.0 turns -0.0 into 0.0
+                bits[integral] = arr[integral].astype(np.int64).view(np.uint64)
+                bits[np.isnan(arr)] = np.float64(np.nan).view(np.uint64)
+            else:
+                bits = arr.astype(np.int64, copy=False).view(np.uint64)
+            column = pd.util.hash_array(bits)
+        else:
+            column = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        hashes = (hashes * np.uint64(0x100000001B3)) ^ column
+    return hashes
+
+
+# Runs of a partition smaller than this many hashes stay in memory when spilling (at most ~16 MB over 256 partitions)
+_SPILL_RUN_SIZE = 1 << 12
+
+
+class _SeenHashes:
+    """Set of the row hashes seen so far, kept as sorted uint64 runs (8 bytes per unique row).
+
+    Like a log-structured merge tree, the new hashes of every chunk become a new sorted run, and the
+    last two runs are merged whenever the older one is less than twice as big. The runs shrink
+    geometrically, so a chunk is checked against O(log n) runs and every hash is merged O(log n) times,
+    rather than the whole set being rebuilt for every chunk. With a spill directory, the hashes are split
+    into 256 partitions by their top byte and the runs of a partition reaching _SPILL_RUN_SIZE hashes are
+    raw uint64 files on disk, memory-mapped when a chunk hits the partition.
+    """
+    n_partitions = 256
+
+    def __init__(self, spill_dir=None):
+        self.spill_dir = spill_dir
+        # Sorted runs of every partition, oldest (& biggest) first: arrays in memory, (path, size) on disk
+        self.runs = [[] for _ in range(1 if spill_dir is None else self.n_partitions)]
+        self._n_files = 0
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+            # Runs left by a previous stream would flag every row of this one as a duplicate
+            for name in os.listdir(spill_dir):
+                if name.startswith('seen_') and name.endswith('.u64'):
+                    os.remove(os.path.join(spill_dir, name))
+
+    def _write(self, run: np.ndarray):
+        if self.spill_dir is None or len(run) < _SPILL_RUN_SIZE:
+            return run
+        path = os.path.join(self.spill_dir, f'seen_{self._n_files:08d}.u64')
+        self._n_files += 1
+        # Raw uint64 files: memory-mapping them skips parsing a .npy header on every chunk
+        run.tofile(path)
+        return path, len(run)
+
+    @staticmethod
+    def _read(run) -> np.ndarray:
+        return np.memmap(run[0], dtype=np.uint64, mode='r', shape=(run[1],)) if isinstance(run, tuple) else run
+
+    @staticmethod
+    def _size(run) -> int:
+        return run[1] if isinstance(run, tuple) else len(run)
+
+    @staticmethod
+    def _delete(run) -> None:
+        if isinstance(run, tuple):
+            os.remove(run[0])
+
+    def _check_and_add_runs(self, runs: list, hashes: np.ndarray) -> np.ndarray:
+        """Return the mask of hashes found in the runs, then add the new unique hashes as a run."""
+        # Sorted queries walk each run in order, which is much more cache-friendly than random ones
+        unique, inverse = np.unique(hashes, return_inverse=True)
+        found = np.zeros(len(unique), dtype=bool)
+        for run in runs:
+            rest = np.flatnonzero(~found)
+            if not len(rest):
+                break
+            seen = self._read(run)
+            pos = np.searchsorted(seen, unique[rest])
+            inside = pos < len(seen)
+            found[rest[inside]] = seen[pos[inside]] == unique[rest[inside]]
+            del seen
+        if not found.all():
+            runs.append(self._write(unique[~found]))
+        while len(runs) > 1 and self._size(runs[-2]) < 2 * self._size(runs[-1]):
+            last, previous = runs.pop(), runs.pop()
+            # Two sorted runs: the stable sort (timsort) merges them in linear time
+            merged = np.sort(np.concatenate([self._read(previous), self._read(last)]), kind='stable')
+            self._delete(previous)
+            self._delete(last)
+            runs.append(self._write(merged))
+        return found[inverse.ravel()]
+
+    def check_and_add(self, hashes: np.ndarray) -> np.ndarray:
+        """Return the mask of hashes seen in a previous call, then add all of them to the set."""
+        if self.spill_dir is None:
+            return self._check_and_add_runs(self.runs[0], hashes)
+
+        found = np.zeros(len(hashes), dtype=bool)
+        partitions = (hashes >> np.uint64(56)).astype(np.intp)
+        order = np.argsort(partitions, kind='stable')
+        bounds = np.searchsorted(partitions[order], np.arange(self.n_partitions + 1))
+        for partition in range(self.n_partitions):
+            rows = order[bounds[partition]:bounds[partition + 1]]
+            if len(rows):
+                found[rows] = self._check_and_add_runs(self.runs[partition], hashes[rows])
+        return found
+
+
+def _record_text(data: pd.DataFrame) -> pd.Series:
+    """Normalise the columns of every row into one string: lower-cased, whitespace collapsed, NA as ''."""
+    text = None
+    for _, values in data.items():
+        column = values.astype('string').fillna('')
+        text = column if text is None else text.str.cat(column, sep=' ')
+    return text.str.lower().str.replace(r'\s+', ' ', regex=True).str.strip()
+
+
+def _minhash_signatures(texts: pd.Series, num_perm: int, ngram: int, max_len: int, seed: int, block_size: int = 8192) -> np.ndarray:
+    """MinHash signatures (n x num_perm, uint32) over the byte n-gram shingles of each string.
+
+    The strings are laid out as a fixed-width byte matrix (truncated to max_len bytes) so the shingles
+    and their hashes are computed with array operations, a block of rows at a time.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 2 ** 64, num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2 ** 64, num_perm, dtype=np.uint64)
+
+    encoded = texts.str.encode('utf-8')
+    lengths = np.minimum(encoded.str.len().to_numpy(dtype=np.int64), max_len)
+    # No wider than the longest record, so short records don't pay for max_len
+    width = max(int(lengths.max(initial=0)), ngram)
+    matrix = np.array(encoded.tolist(), dtype=f'S{width}').view(np.uint8).reshape(len(texts), width)
+    n_shingles = width - ngram + 1
+    # Strings shorter than one shingle still get their (padded) first shingle
+    n_valid = np.maximum(lengths - ngram + 1, 1)
+
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint32)
+    for start in range(0, len(texts), block_size):
+        block = matrix[start:start + block_size].astype(np.uint64)
+        shingles = np.zeros((len(block), n_shingles), dtype=np.uint64)
+        for k in range(ngram):
+            shingles = (shingles << np.uint64(8)) | block[:, k:k + n_shingles]
+        invalid = np.arange(n_shingles) >= n_valid[start:start + block_size, None]
+        for p in range(num_perm):
+            # Multiply-shift universal hashing: the top 32 bits of a*x + b (mod 2^64), with random 64-bit a & b
+            hashed = (shingles * a[p] + b[p]) >> np.uint64(32)
+            hashed[invalid] = np.iinfo(np.uint32).max
+            signatures[start:start + block_size, p] = hashed.min(axis=1)
+    return signatures
+
+
+def _candidate_pairs(texts: pd.Series, signatures: np.ndarray, blocking: str, bands: int, window: int):
+    """Candidate pairs (left, right) of row positions produced by the blocking step."""
+    left, right = [], []
+    if blocking == 'lsh':
+        rows_per_band = signatures.shape[1] // bands
+        for band in range(bands):
+            # One bucket key per row & band, folded from the band's signature values
+            key = np.zeros(len(signatures), dtype=np.uint64)
+            for value in signatures[:, band * rows_per_band:(band + 1) * rows_per_band].T:
+                key = (key * np.uint64(0x100000001B3)) ^ value.astype(np.uint64)
+            order = np.argsort(key, kind='stable')
+            same = key[order][1:] == key[order][:-1]
+            # Link every member of a bucket to the previous member & to the first member of the bucket
+            leaders = order[np.flatnonzero(np.r_[True, ~same])][np.cumsum(np.r_[True, ~same]) - 1]
+            left += [order[:-1][same], leaders[1:][same]]
+            right += [order[1:][same], order[1:][same]]
+    elif blocking == 'sorted':
+        # Sorted neighbourhood: compare every record with the next `window` records in sorted order,
+        # sorting on the text & on the reversed text so a typo at the start doesn't hide a pair
+        for key in (texts, texts.str[::-1]):
+            order = np.argsort(key.to_numpy(dtype=object), kind='stable')
+            for distance in range(1, window + 1):
+                left.append(order[:-distance])
+                right.append(order[distance:])
+    else:
+        raise ValueError("Invalid value for blocking. Please provide 'lsh' or 'sorted'.")
+    left, right = np.concatenate(left), np.concatenate(right)
+    keep = left != right
+    return left[keep], right[keep]
+
+
+def _duplicated_mask(data: pd.DataFrame, subset=None, keep='first', method='exact', verify=True) -> np.ndarray:
+    """Boolean array flagging the duplicated rows of a DataFrame (same semantics as DataFrame.duplicated).
+
+    method='hash' hashes every row into a 64-bit key and looks for duplicates on that 1-d uint64 array,
+    instead of keeping the factorized codes of every column alive at once. With verify=True, only the
+    rows whose hash collides are compared exactly, so the result is exact; with verify=False a (very
+    unlikely, ~n²/2⁶⁵) hash collision is reported as a duplicate.
+    """
+    if method == 'exact':
+        return data.duplicated(subset=subset, keep=keep).to_numpy()
+    if method != 'hash':
+        raise ValueError("Invalid value for method. Please provide 'exact' or 'hash'.")
+
+    data = _select(data, subset)
+    hashes = _row_hashes(data)
+    if not verify:
+        return pd.Series(hashes).duplicated(keep=keep).to_numpy()
+
+    # Only the rows sharing a hash with another row can be duplicates: compare those exactly
+    candidates = np.flatnonzero(pd.Series(hashes).duplicated(keep=False).to_numpy())
+    mask = np.zeros(len(data), dtype=bool)
+    if len(candidates):
+        mask[candidates] = data.iloc[candidates].duplicated(keep=keep).to_numpy()
+    return mask
+
 #!############################# # Treat Duplicated Values Class # ##############################
 
 class FindTreatDuplicates:
@@ -14,13 +261,15 @@ class FindTreatDuplicates:
     #* (1) Method 
     @classmethod
     @get_time
-    def find_duplicates(cls, data: pd.DataFrame, subset=None, identify_all=False) -> pd.DataFrame:
+    def find_duplicates(cls, data: pd.DataFrame, subset=None, identify_all=False, method='exact', verify=True) -> pd.DataFrame:
         """Idenfify duplicated values in DataFrame. 
 
         Parameters:
             - data (pd.DataFrame): pd.DataFrame
             - subset (list | pd.Series): A list of features OR a singular searies. Default = None (return duplicates for the intire dataset).
             - identify_all (bool, optional): If 'first' specified, then return only the first instances of the duplicated values. Defaults to False (identify all duplicated values). If 'last' return only the last instances of the duplicated values. Defaults to False (identify all duplicated values)
+            - method (str, optional): 'exact' (DataFrame.duplicated) or 'hash' (64-bit row hashes, much lower peak memory on large & wide frames). Defaults to 'exact'.
+            - verify (bool, optional): With method='hash', compare the rows whose hashes collide exactly so the result is exact. Defaults to True.
         
         Example usage:
         --------------
@@ -57,19 +306,21 @@ class FindTreatDuplicates:
             CleanData.find_treat_duplicates.FindTreatDuplicates.find_duplicates(df, subset='id')
 
         """
-        return data[data.duplicated(subset=subset, keep=identify_all)]            
+        return data[_duplicated_mask(data, subset=subset, keep=identify_all, method=method, verify=verify)]
     
     
     #* (2) Method 
     @classmethod
     @get_time
-    def drop_duplicates(cls, data: pd.DataFrame, subset=None, identify_all='first') -> pd.DataFrame:
+    def drop_duplicates(cls, data: pd.DataFrame, subset=None, identify_all='first', method='exact', verify=True) -> pd.DataFrame:
         """Drop duplicated values in DataFrame. 
 
         Parameters:
             - data (pd.DataFrame): pd.DataFrame
             - subset (list | pd.Series): A list of features OR a singular searies. Default = None (applies to all features).
             - identify_all (bool, optional): Defaults to 'first' (drop all duplicated values but keep the 'first' instances); If 'last' return only the last instances of the duplicated values; If False = drop all duplicates.
+            - method (str, optional): 'exact' (DataFrame.duplicated) or 'hash' (64-bit row hashes, much lower peak memory on large & wide frames). Defaults to 'exact'.
+            - verify (bool, optional): With method='hash', compare the rows whose hashes collide exactly so the result is exact. Defaults to True.
         
         Example usage:
         --------------
@@ -102,7 +353,127 @@ class FindTreatDuplicates:
             # Shuffling the dataframe to mix duplicates
             df = df.sample(frac=1).reset_index(drop=True)
 
-            # Return all the duplicated values
+            # Drop the duplicated values
             CleanData.find_treat_duplicates.FindTreatDuplicates.drop_duplicates(df, subset='id')
+
+            # Hash-based mode for very large frames
+            CleanData.FindTreatDuplicates.drop_duplicates(df, method='hash')
         """
-        return data.drop_duplicates(subset=subset, keep=identify_all, inplace=True)       
+        return data[~_duplicated_mask(data, subset=subset, keep=identify_all, method=method, verify=verify)]
+
+
+
+    #* (3) Method
+    @classmethod
+    def drop_duplicates_chunked(cls, chunks, subset=None, flag_column=None, spill_dir=None):
+        """Drop (or flag) duplicated rows across a stream of DataFrame chunks that don't fit in memory together.
+
+        Each row is hashed into a 64-bit key from its values, and the hashes seen so far are kept in a
+        compact sorted array (8 bytes per unique row), optionally spilled to disk in hash partitions.
+        A row is a duplicate when the same row appeared earlier, in a previous chunk or earlier in the
+        same chunk (keep='first' semantics across chunks). Rows are compared by their 64-bit hash only.
+
+        Parameters:
+            - chunks (iterable of pd.DataFrame): The chunks, e.g. pd.read_csv(path, chunksize=...) or a generator over daily extracts.
+            - subset (list | str): A list of features OR a singular feature to compare rows on. Default = None (all features).
+            - flag_column (str, optional): Name of a boolean column flagging the duplicates instead of dropping them. Defaults to None (drop).
+            - spill_dir (str, optional): Directory where the seen hashes are kept as hash-partitioned run files (seen_*.u64) instead of in memory; files left there by a previous run are deleted when the stream starts. Defaults to None.
+
+        Yields:
+            pd.DataFrame: Each chunk without its duplicates (or with the flag column added).
+
+        Example usage:
+        --------------
+        .. code-block:: python
+
+            # Import dependencies
+            import pandas as pd
+            import CleanData
+
+            # De-duplicate a month of daily extracts, writing the result one chunk at a time
+            extracts = (pd.read_csv(f'extract_{day:02d}.csv') for day in range(1, 31))
+            for chunk in CleanData.FindTreatDuplicates.drop_duplicates_chunked(extracts, subset=['id', 'amount']):
+                chunk.to_csv('deduplicated.csv', mode='a', header=False, index=False)
+        """
+        seen = _SeenHashes(spill_dir)
+        for chunk in chunks:
+            hashes = _stable_row_hashes(_select(chunk, subset))
+            # Duplicates of a previous chunk | duplicates within this chunk
+            duplicated = seen.check_and_add(hashes) | pd.Series(hashes).duplicated(keep='first').to_numpy()
+            if flag_column is None:
+                yield chunk[~duplicated]
+            else:
+                chunk = chunk.copy()
+                chunk[flag_column] = duplicated
+                yield chunk
+
+
+
+    #* (4) Method
+    @classmethod
+    @get_time
+    def find_near_duplicates(cls, data: pd.DataFrame, subset=None, threshold: float = 0.7, blocking='lsh', num_perm: int = 64, bands: int = 16, window: int = 5, ngram: int = 3, max_len: int = 64, seed: int = 0) -> pd.Series:
+        """Cluster near-duplicated rows (e.g. 'Jon Smith' & 'John Smith' at the same address) in roughly linear time.
+
+        Every row is normalised into one string (lower-cased, whitespace collapsed) and summarised by a MinHash
+        signature of its character n-grams. A blocking step produces the candidate pairs - rows sharing a bucket
+        in any LSH band ('lsh'), or rows close to each other once sorted on their text & reversed text ('sorted'
+        neighbourhood) - and only those pairs are scored, by the Jaccard similarity estimated from their signatures.
+        Pairs scoring at least `threshold` are linked, and the connected rows form a cluster.
+
+        Parameters:
+            - data (pd.DataFrame): pd.DataFrame
+            - subset (list | str): A list of features OR a singular feature to compare rows on. Default = None (all features).
+            - threshold (float, optional): Min estimated Jaccard similarity of the n-gram sets for two rows to be near-duplicates. Defaults to 0.7.
+            - blocking (str, optional): 'lsh' (MinHash LSH banding) or 'sorted' (sorted neighbourhood). Defaults to 'lsh'.
+            - num_perm (int, optional): Number of MinHash permutations (signature length). Defaults to 64.
+            - bands (int, optional): Number of LSH bands; more bands find pairs with a lower similarity. Defaults to 16.
+            - window (int, optional): Number of following records compared with each record with blocking='sorted'. Defaults to 5.
+            - ngram (int, optional): Size of the character n-grams (1 to 8). Defaults to 3.
+            - max_len (int, optional): Records are truncated to this many bytes before shingling. Defaults to 64.
+            - seed (int, optional): Seed of the MinHash permutations. Defaults to 0.
+
+        Returns:
+            pd.Series: Cluster ID of every row, aligned to data.index (rows without near-duplicates get their own ID).
+
+        Example usage:
+        --------------
+        .. code-block:: python
+
+            # Import dependencies
+            import pandas as pd
+            import CleanData
+
+            customers = pd.DataFrame({
+                'name': ['Jon Smith', 'John Smith', 'Jane Doe', 'Jane  DOE', 'Emily Stone'],
+                'address': ['12 Main St', '12 Main St', '3 Oak Ave', '3 Oak Ave', '7 Pine Rd'],
+            })
+
+            # Rows sharing a cluster are near-duplicates
+            customers['cluster'] = CleanData.FindTreatDuplicates.find_near_duplicates(customers, threshold=0.6)
+        """
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+
+        if not 1 <= ngram <= 8:
+            raise ValueError("Invalid value for ngram. Please provide an integer between 1 and 8.")
+        if not len(data):
+            return pd.Series(np.empty(0, dtype=np.int64), index=data.index, name='cluster')
+
+        # Identical records are scored once
+        codes, texts = pd.factorize(_record_text(_select(data, subset)))
+        texts = pd.Series(texts, dtype='string')
+        signatures = _minhash_signatures(texts, num_perm, ngram, max_len, seed)
+        left, right = _candidate_pairs(texts, signatures, blocking, bands, window)
+
+        # Score the candidate pairs only, a block at a time to bound the (pairs x num_perm) comparison
+        linked = np.zeros(len(left), dtype=bool)
+        for start in range(0, len(left), 65536):
+            i, j = left[start:start + 65536], right[start:start + 65536]
+            linked[start:start + 65536] = (signatures[i] == signatures[j]).mean(axis=1) >= threshold
+
+        graph = coo_matrix((np.ones(linked.sum(), dtype=np.int8), (left[linked], right[linked])), shape=(len(texts), len(texts)))
+        _, labels = connected_components(graph, directed=False)
+        # Number the clusters by first appearance
+        clusters = pd.factorize(labels[codes])[0]
+        return pd.Series(clusters, index=data.index, name='cluster')
@@ -1,11 +1,298 @@
 
 # Import Dependencies
+import os
+from importlib.util import find_spec
+from typing import NamedTuple
+
 import numpy as np
 import pandas as pd
 
 
 from ._utils import get_time
 
+
+# (numpy dtype, nullable counterpart) ladders, narrowest first; int64 comes before uint64
+# for non-negative columns so 64-bit columns only turn unsigned when they need to
+_UNSIGNED = ((np.uint8, "UInt8"), (np.uint16, "UInt16"), (np.uint32, "UInt32"), (np.int64, "Int64"), (np.uint64, "UInt64"))
+_SIGNED = ((np.int8, "Int8"), (np.int16, "Int16"), (np.int32, "Int32"), (np.int64, "Int64"))
+
+# Rows scanned per block when collecting column statistics: small enough for a
+# block to stay in cache while min, max, NaN & integrality are all computed on it
+_BLOCK_SIZE = 1 << 16
+
+
+class _ColumnStats(NamedTuple):
+    """Statistics of a numeric column: range of the non-null values, null count & integrality."""
+    min: float
+    max: float
+    nulls: int
+    integral: bool
+
+    def merge(self, other: '_ColumnStats') -> '_ColumnStats':
+        return _ColumnStats(min(self.min, other.min), max(self.max, other.max), self.nulls + other.nulls, self.integral and other.integral)
+
+
+def _is_numeric(values: pd.Series) -> bool:
+    """Real numbers only: booleans & complex numbers (whose imaginary part would be dropped) aren't downcast."""
+    return pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values) \
+        and not pd.api.types.is_complex_dtype(values)
+
+
+def _column_stats(values: pd.Series) -> _ColumnStats:
+    """Collect min, max, null count & integrality of a numeric column in a single blocked pass over its memory."""
+    if isinstance(values.dtype, pd.api.extensions.ExtensionDtype):
+        # Nullable Int*/Float* columns: count the mask, then scan the valid values
+        nulls = int(values.isna().sum())
+        arr = values.dropna().to_numpy(dtype=values.dtype.numpy_dtype)
+    else:
+        nulls, arr = 0, values.to_numpy()
+
+    lo, hi, integral = np.inf, -np.inf, True
+    is_float = arr.dtype.kind == "f"
+    for start in range(0, len(arr), _BLOCK_SIZE):
+        block = arr[start:start + _BLOCK_SIZE]
+        if is_float:
+            nan = np.isnan(block)
+            n_nan = int(nan.sum())
+            if n_nan:
+                nulls += n_nan
+                block = block[~nan]
+            if not block.size:
+                continue
+            if integral:
+                integral = bool(np.isfinite(block).all() and (block == np.trunc(block)).all())
+        lo, hi = min(lo, block.min()), max(hi, block.max())
+    return _ColumnStats(lo, hi, nulls, integral)
+
+
+def _numeric_dtype(stats: _ColumnStats):
+    """Return the narrowest dtype able to hold a column exactly, None when it has no valid value.
+
+    Integral columns get an unsigned dtype when they have no negative value, and a
+    nullable Int*/UInt* dtype when they contain nulls (e.g. integer-valued floats with NaN).
+    """
+    if stats.min > stats.max:
+        return None
+    # ? Treating integer(-valued) columns
+    if stats.integral:
+        for dtype, nullable in (_UNSIGNED if stats.min >= 0 else _SIGNED):
+            info = np.iinfo(dtype)
+            if info.min <= stats.min and stats.max <= info.max:
+                return pd.api.types.pandas_dtype(nullable) if stats.nulls else np.dtype(dtype)
+    # ? Treating float columns (float16 is only picked by the precision check of _float_dtype)
+    if stats.min > np.finfo(np.float32).min and stats.max < np.finfo(np.float32).max:
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def _float_dtype(values: pd.Series, stats: _ColumnStats, rtol: float, atol: float, sample=None):
+    """Return the narrowest float dtype whose rounding error stays within |x - cast(x)| <= atol + rtol * |x|.
+
+    float16 then float32 are tried on the whole column (or on `sample` random rows), block by block.
+    Returns the dtype with the worst absolute & relative error it introduces.
+    """
+    arr = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    if sample is not None and sample < len(arr):
+        arr = arr[np.sort(np.random.default_rng(0).choice(len(arr), sample, replace=False))]
+
+    for dtype in (np.float16, np.float32):
+        info = np.finfo(dtype)
+        if not (info.min <= stats.min and stats.max <= info.max):
+            continue
+        abs_error = rel_error = 0.0
+        for start in range(0, len(arr), _BLOCK_SIZE):
+            block = arr[start:start + _BLOCK_SIZE]
+            block = block[~np.isnan(block)]
+            error = np.abs(block - block.astype(dtype).astype(np.float64))
+            if (error > atol + rtol * np.abs(block)).any():
+                break
+            if error.size:
+                abs_error = max(abs_error, float(error.max()))
+                nonzero = block != 0
+                if nonzero.any():
+                    rel_error = max(rel_error, float((error[nonzero] / np.abs(block[nonzero])).max()))
+        else:
+            return np.dtype(dtype), abs_error, rel_error
+    return np.dtype(np.float64), 0.0, 0.0
+
+
+def _is_text(dtype) -> bool:
+    return dtype == object or isinstance(dtype, pd.StringDtype)
+
+
+# Arrow-backed strings are only used when pyarrow is installed
+STRING_DTYPE = pd.StringDtype("pyarrow") if find_spec("pyarrow") else None
+
+# Text tokens recognised as booleans (compared lower-cased & stripped)
+BOOL_VALUES = {'true': True, 'false': False, 'yes': True, 'no': False, 'y': True, 'n': False, '1': True, '0': False}
+
+
+def _text_dtype(n_unique: int, n_rows: int, category_threshold, string_threshold):
+    """Pick 'category' for low-cardinality text, arrow strings for high-cardinality text, else None."""
+    ratio = n_unique / n_rows if n_rows else 1.0
+    if category_threshold is not None and ratio <= category_threshold:
+        return "category"
+    if string_threshold is not None and ratio >= string_threshold and STRING_DTYPE is not None:
+        return STRING_DTYPE
+    return None
+
+
+def _text_to_bool(values: pd.Series, codes=None, uniques=None):
+    """Map a boolean-like text column to bool (nullable 'boolean' when it has NA); None when it isn't boolean-like."""
+    if codes is None:
+        try:
+            codes, uniques = pd.factorize(values)
+        except TypeError:
+            # Unhashable values (lists, dicts, ...)
+            return None
+    if not 0 < len(uniques) <= len(BOOL_VALUES):
+        return None
+    # Only actual strings are boolean-like: Python ints 0/1 in an object column aren't text
+    flags = pd.Series(uniques, dtype=object).map(lambda v: BOOL_VALUES.get(v.strip().lower()) if isinstance(v, str) else None)
+    if flags.isna().any():
+        return None
+    flags = flags.to_numpy(dtype=bool)[codes]
+    missing = codes == -1
+    if missing.any():
+        return pd.Series(pd.arrays.BooleanArray(flags, missing), index=values.index)
+    return pd.Series(flags, index=values.index)
+
+
+def _convert_text(values: pd.Series, category_threshold, string_threshold, convert_bool: bool):
+    """Convert an object/string column to bool, category or arrow strings; None when no conversion applies.
+
+    The column is factorized once and the codes are reused to build the booleans
+    or the categorical, so the values are hashed a single time. Columns holding
+    unhashable values (lists, dicts, ...) are left as they are.
+    """
+    try:
+        codes, uniques = pd.factorize(values)
+    except TypeError:
+        return None
+    if convert_bool:
+        flags = _text_to_bool(values, codes, uniques)
+        if flags is not None:
+            return flags
+
+    dtype = _text_dtype(len(uniques), len(values), category_threshold, string_threshold)
+    if dtype == "category":
+        # Categories inferred from a plain list, like the ones rebuilt from a saved dtype plan
+        return pd.Series(pd.Categorical.from_codes(codes, pd.Index(uniques.tolist())), index=values.index)
+    if dtype is not None and values.dtype == object:
+        return values.astype(dtype)
+    return None
+
+
+#!############################# # Dtype plans # ##############################
+
+PLAN_VERSION = 1
+
+
+def _dtype_spec(dtype) -> dict:
+    """JSON-serialisable description of a dtype."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return {'dtype': 'category', 'categories': dtype.categories.tolist(), 'ordered': bool(dtype.ordered)}
+    if isinstance(dtype, pd.StringDtype) and getattr(dtype, 'na_value', pd.NA) is pd.NA:
+        # str() drops the storage ('string'), keep it so arrow strings stay arrow strings
+        return {'dtype': f'string[{dtype.storage}]'}
+    return {'dtype': str(dtype)}
+
+
+def _spec_dtype(spec: dict):
+    if spec['dtype'] == 'category':
+        return pd.CategoricalDtype(spec['categories'], ordered=spec.get('ordered', False))
+    return pd.api.types.pandas_dtype(spec['dtype'])
+
+
+def _check_cast(col, values: pd.Series, dtype) -> None:
+    """Raise a ValueError when casting a column to a planned dtype would overflow or lose values."""
+    if pd.api.types.is_complex_dtype(values) and dtype.kind in 'iuf':
+        raise ValueError(f"Column {col!r} has complex values, it can't be cast to {dtype}.")
+    if _is_numeric(values) and dtype.kind in 'iuf':
+        stats = _column_stats(values)
+        nullable = isinstance(dtype, pd.api.extensions.ExtensionDtype)
+        numpy_dtype = np.dtype(getattr(dtype, 'numpy_dtype', dtype))
+        if dtype.kind in 'iu':
+            if stats.nulls and not nullable:
+                raise ValueError(f"Column {col!r} has {stats.nulls} null values, it can't be cast to {dtype}.")
+            if not stats.integral:
+                raise ValueError(f"Column {col!r} has non-integer values, it can't be cast to {dtype}.")
+            info = np.iinfo(numpy_dtype)
+        else:
+            info = np.finfo(numpy_dtype)
+        # +/-inf are representable by every float dtype, only finite values can overflow
+        if (info.min > stats.min > -np.inf) or (np.inf > stats.max > info.max):
+            raise ValueError(f"Column {col!r} ranges over [{stats.min}, {stats.max}], which overflows {dtype}.")
+    elif isinstance(dtype, pd.CategoricalDtype):
+        unseen = pd.Index(values.dropna().unique()).difference(dtype.categories)
+        if len(unseen):
+            raise ValueError(f"Column {col!r} has values missing from the planned categories: {unseen[:5].tolist()}.")
+
+
+def _apply_plan(data: pd.DataFrame, plan: dict, check=True) -> pd.DataFrame:
+    """Cast a DataFrame to the dtypes of a plan made by Memory.dtype_plan, without computing a new plan.
+
+    Every column is checked before anything is cast, so an overflowing batch fails fast.
+    """
+    if plan.get('version') != PLAN_VERSION:
+        raise ValueError(f"Unsupported dtype plan version {plan.get('version')!r}, expected {PLAN_VERSION}.")
+    dtypes = {spec['name']: _spec_dtype(spec) for spec in plan['columns']}
+    missing = [col for col in dtypes if col not in data.columns]
+    if missing:
+        raise ValueError(f"Columns {missing} of the dtype plan are missing from the data.")
+
+    casts, converted = {}, {}
+    for col, dtype in dtypes.items():
+        values = data[col]
+        if values.dtype == dtype:
+            continue
+        if pd.api.types.is_bool_dtype(dtype) and _is_text(values.dtype):
+            # Boolean-like text can't go through astype ('false' would become True)
+            flags = _text_to_bool(values)
+            if flags is None or (flags.dtype != bool and dtype == bool):
+                raise ValueError(f"Column {col!r} has values that aren't boolean-like, it can't be cast to {dtype}.")
+            converted[col] = flags.astype(dtype)
+            continue
+        if check:
+            _check_cast(col, values, dtype)
+        casts[col] = dtype
+
+    if casts:
+        data = data.astype(casts)
+    if converted:
+        # Shallow copy so the boolean columns are never replaced in the caller's DataFrame
+        data = data.copy(deep=False)
+    for col, flags in converted.items():
+        data[col] = flags
+    return data
+
+
+def _chunk_source(source, chunksize: int, dtype=None, reread=True, **read_kwargs):
+    """Return a zero-argument callable yielding the DataFrame chunks of a source.
+
+    The source can be a CSV/Parquet file path, a callable returning an iterable
+    of chunks, or a re-iterable collection of DataFrames (e.g. a list).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.endswith(('.parquet', '.pq')):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Reading Parquet files in chunks requires pyarrow: pip install pyarrow") from e
+
+            def read():
+                for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, **read_kwargs):
+                    chunk = batch.to_pandas()
+                    yield chunk.astype(dtype) if dtype else chunk
+            return read
+        return lambda: pd.read_csv(path, chunksize=chunksize, dtype=dtype, **read_kwargs)
+    if callable(source):
+        return lambda: (chunk.astype(dtype) if dtype else chunk for chunk in source())
+    if reread and iter(source) is source:
+        raise TypeError("A one-shot iterator can't be read twice; pass a file path, a list of chunks or a callable returning the chunks.")
+    return lambda: (chunk.astype(dtype) if dtype else chunk for chunk in source)
+
 #!############################# # Memory Optimisation # ##############################
 
 class Memory:
@@ -16,16 +303,33 @@ class Memory:
     #* (1) Method 
     @classmethod
     @get_time
-    def optimise_mem(cls, data: pd.DataFrame, verbose=True) -> pd.DataFrame:
+    def optimise_mem(cls, data: pd.DataFrame, verbose=True, category_threshold: float = 0.5, string_threshold: float = 0.5, convert_bool=True, float_rtol: float = None, float_atol: float = None, float_sample: int = None, plan: dict = None, check_plan=True, return_report=False) -> pd.DataFrame:
         """
         Optimize memory usage of a DataFrame.
 
+        Numeric columns are downcast to the smallest dtype holding their range (unsigned integers for non-negative
+        columns, nullable Int*/UInt* for integer-valued floats with NaN), and text (object/string) columns
+        are converted based on their cardinality: boolean-like columns ('yes'/'no', 'true'/'false', 'y'/'n', '1'/'0')
+        become bool (nullable 'boolean' when they contain NA), low-cardinality columns become 'category' and
+        high-cardinality columns become 'string[pyarrow]' (when pyarrow is installed).
+
         Parameters:
             - data (pd.DataFrame): Input DataFrame to be optimized.
             - verbose (bool, optional): Whether to display memory reduction information. Defaults to True.
+            - category_threshold (float, optional): Max ratio of unique values to rows for a text column to become 'category'; None disables it. Defaults to 0.5.
+            - string_threshold (float, optional): Min ratio of unique values to rows for an object column to become 'string[pyarrow]'; None disables it. Defaults to 0.5.
+            - convert_bool (bool, optional): Whether to convert boolean-like text columns to bool/'boolean'. Defaults to True.
+            - float_rtol (float, optional): Opt-in precision check: relative error allowed when downcasting float columns (float16 is used when it fits the budget). Defaults to None (float columns go to float32 based on their range only).
+            - float_atol (float, optional): Opt-in precision check: absolute error allowed when downcasting float columns. Defaults to None.
+            - float_sample (int, optional): Number of random rows used for the precision check. Defaults to None (the whole column).
+            - plan (dict, optional): Dtype plan saved from Memory.dtype_plan; the data is cast to it without computing a new plan. Defaults to None.
+            - check_plan (bool, optional): Whether to check that the data fits the plan (no overflow, no unseen categories) before casting. Defaults to True.
+            - return_report (bool, optional): Whether to also return the per-column before/after byte report. Defaults to False.
 
         Returns:
             pd.DataFrame: Optimized DataFrame with reduced memory usage.
+            (pd.DataFrame, pd.DataFrame): When return_report=True, the optimized DataFrame & a report indexed by column with 'dtype_before', 'dtype_after', 'bytes_before' and 'bytes_after'
+            (plus 'max_abs_error' & 'max_rel_error' introduced in the float columns when the precision check is enabled).
         
         Example usage: 
         --------------
@@ -47,41 +351,239 @@ class Memory:
             # Check your corrent memory: 
             data.info()
 
-            # Optimise your DataFrame memory usage
-            CleanData.Memory.optimise_mem(data)
+            # Optimise your DataFrame memory usage (a new DataFrame is returned)
+            data = CleanData.Memory.optimise_mem(data)
+
+            # Inspect what happened to each column
+            data, report = CleanData.Memory.optimise_mem(data, return_report=True)
+
+            # Downcast sensor-style floats as far as float16, as long as the relative error stays below 0.1%
+            data, report = CleanData.Memory.optimise_mem(data, float_rtol=1e-3, return_report=True)
+
+            # Learn the dtypes once, save them & apply them to the next batches without re-planning
+            plan = CleanData.Memory.dtype_plan(data)
+            json.dump(plan, open('plan.json', 'w'))
+            next_batch = CleanData.Memory.optimise_mem(next_batch, plan=json.load(open('plan.json')))
 
         """      
-        # Create a function to optimise the memory
-        start_mem = data.memory_usage().sum() / 1024 ** 2
-        numerics = ["int8", "int16", "int32", "int64", "float16", "float32", "float64"]
-        for col in data.columns:
-            col_type = data[col].dtypes
-            if col_type in numerics:
-                # Retrieve the min and max values of a column
-                c_min = data[col].min()
-                c_max = data[col].max()
-                # ? Treating integer columns
-                if str(col_type)[:3] == "int":
-                    if c_min > np.iinfo(np.int8).min and c_max < np.iinfo(np.int8).max:
-                        data[col] = data[col].astype(np.int8)
-                    elif c_min > np.iinfo(np.int16).min and c_max < np.iinfo(np.int16).max:
-                        data[col] = data[col].astype(np.int16)
-                    elif c_min > np.iinfo(np.int32).min and c_max < np.iinfo(np.int32).max:
-                        data[col] = data[col].astype(np.int32)
-                    elif c_min > np.iinfo(np.int64).min and c_max < np.iinfo(np.int64).max:
-                        data[col] = data[col].astype(np.int64)
-                # ? Treating float columns 
-                else:
-                    if c_min > np.finfo(np.float16).min and c_max < np.finfo(np.float16).max:
-                        data[col] = data[col].astype(np.float32)
-                    elif c_min > np.finfo(np.float32).min and c_max < np.finfo(np.float32).max:
-                        data[col] = data[col].astype(np.float32)
-                    else:
-                        data[col] = data[col].astype(np.float64)
+        # Create a function to optimise the memory (deep=True so text columns are measured by their content)
+        dtypes_before = data.dtypes
+        if verbose or return_report:
+            bytes_before = data.memory_usage(deep=True, index=False)
+            start_mem = bytes_before.sum() / 1024 ** 2
+        check_floats = plan is None and (float_rtol is not None or float_atol is not None)
+        errors = {}
+        if plan is not None:
+            # Saved plan: nothing to learn, the data is (checked &) cast straight away
+            data = _apply_plan(data, plan, check=check_plan)
+        else:
+            casts, converted = {}, {}
+            for col, values in data.items():
+                if _is_numeric(values):
+                    # Retrieve the min, max, null count & integrality of a column in one pass
+                    stats = _column_stats(values)
+                    dtype = _numeric_dtype(stats)
+                    if check_floats and dtype is not None and dtype.kind == "f":
+                        dtype, *errors[col] = _float_dtype(values, stats, float_rtol or 0.0, float_atol or 0.0, float_sample)
+                    # Never widen a column (e.g. float16 -> float32)
+                    if dtype is not None and dtype.itemsize < values.dtype.itemsize:
+                        casts[col] = dtype
+                # ? Treating text columns
+                elif _is_text(values.dtype):
+                    text = _convert_text(values, category_threshold, string_threshold, convert_bool)
+                    if text is not None:
+                        converted[col] = text
+            # Apply every numeric cast at once rather than replacing the columns one by one
+            if casts:
+                data = data.astype(casts)
+            if converted:
+                # Shallow copy so the text columns are never replaced in the caller's DataFrame
+                data = data.copy(deep=False)
+            for col, text in converted.items():
+                data[col] = text
+
+        if not (verbose or return_report):
+            return data
+
         # Returning the end megabytes calculation (reduction)
-        end_mem = data.memory_usage().sum() / 1024 ** 2
+        bytes_after = data.memory_usage(deep=True, index=False)
+        end_mem = bytes_after.sum() / 1024 ** 2
 
         if verbose:
-            print("Mem. usage decreased to {:.2f} Mb ({:.1}% reduction)".format(end_mem, 100 * ((start_mem - end_mem) / start_mem)))
-        
-        return data 
\ No newline at end of file
+            print("Mem. usage decreased to {:.2f} Mb ({:.1f}% reduction)".format(end_mem, 100 * ((start_mem - end_mem) / start_mem) if start_mem else 0))
+
+        if return_report:
+            report = pd.DataFrame({
+                'dtype_before': dtypes_before.astype(str),
+                'dtype_after': data.dtypes.astype(str),
+                'bytes_before': bytes_before,
+                'bytes_after': bytes_after,
+            })
+            if check_floats:
+                report = report.join(pd.DataFrame.from_dict(errors, orient='index', columns=['max_abs_error', 'max_rel_error']))
+            return data, report
+        return data
+
+
+
+    #* (2) Method
+    @classmethod
+    @get_time
+    def optimise_mem_chunked(cls, source, chunksize: int = 100_000, category_threshold: float = 0.5, string_threshold: float = 0.5, max_categories: int = 100_000, plan: dict = None, check_plan=True, verbose=True, **read_kwargs) -> pd.DataFrame:
+        """
+        Load a CSV/Parquet file (or a collection of chunks) straight into memory optimised dtypes.
+
+        The data is read twice, one chunk at a time, so the full DataFrame never exists at its default
+        int64/float64/object dtypes:
+            1. The first pass collects the min/max, null count & integrality of the numeric columns and the unique values of the text columns.
+            2. The second pass re-reads each chunk with the inferred downcast dtypes (and category dtypes for low-cardinality text).
+        A column read as numbers in some chunks and as text in others is loaded as text (string[pyarrow] or object) in every chunk.
+        With a saved dtype plan, the first pass is skipped and each chunk is cast to the plan as it is read.
+
+        Parameters:
+            - source (str | os.PathLike | callable | list): Path to a .csv or .parquet file, a callable returning an iterable of DataFrame chunks, or a list of DataFrame chunks.
+            - chunksize (int, optional): Number of rows per chunk when reading a file. Defaults to 100_000.
+            - category_threshold (float, optional): Max ratio of unique values to rows for a text column to become 'category'. Defaults to 0.5.
+            - string_threshold (float, optional): Min ratio of unique values to rows for a text column to become 'string[pyarrow]' (when pyarrow is installed). Defaults to 0.5.
+            - max_categories (int, optional): Max number of unique values tracked per text column during the first pass (bounds its memory). Defaults to 100_000.
+            - plan (dict, optional): Dtype plan saved from Memory.dtype_plan, read in a single pass (one-shot iterators are accepted). Defaults to None.
+            - check_plan (bool, optional): Whether to check that each chunk fits the plan before casting it. Defaults to True.
+            - verbose (bool, optional): Whether to display the estimated peak memory of the two-pass load next to a naive load. Defaults to True.
+            - **read_kwargs: Extra keyword arguments passed to pd.read_csv / pyarrow ParquetFile.iter_batches.
+
+        Returns:
+            pd.DataFrame: Optimized DataFrame with reduced memory usage.
+
+        Example usage:
+        --------------
+        ..  code-block:: python
+
+            # Import dependencies
+            import CleanData
+
+            # Load a file that doesn't fit in memory at its default dtypes
+            data = CleanData.Memory.optimise_mem_chunked('transactions.csv', chunksize=500_000)
+
+            # Or optimise chunks produced by your own reader
+            data = CleanData.Memory.optimise_mem_chunked(lambda: pd.read_sql(query, con, chunksize=100_000))
+        """
+        naive_bytes = peak_chunk_bytes = 0
+        if plan is not None:
+            # Saved plan: a single pass casting every chunk as soon as it is read
+            chunks = []
+            for chunk in _chunk_source(source, chunksize, reread=False, **read_kwargs)():
+                if verbose:
+                    chunk_bytes = chunk.memory_usage(deep=True).sum()
+                    naive_bytes += chunk_bytes
+                    peak_chunk_bytes = max(peak_chunk_bytes, chunk_bytes)
+                chunks.append(_apply_plan(chunk, plan, check=check_plan))
+        else:
+            # First pass: statistics of numeric columns & unique values of text columns
+            stats, uniques, string_cols = {}, {}, set()
+            kinds, mixed = {}, set()
+            n_rows = 0
+            for chunk in _chunk_source(source, chunksize, **read_kwargs)():
+                n_rows += len(chunk)
+                chunk_bytes = chunk.memory_usage(deep=True).sum()
+                naive_bytes += chunk_bytes
+                peak_chunk_bytes = max(peak_chunk_bytes, chunk_bytes)
+                for col in chunk.columns:
+                    values = chunk[col]
+                    kind = 'numeric' if _is_numeric(values) else 'text' if _is_text(values.dtype) else None
+                    if kind is None or col in mixed:
+                        continue
+                    if kinds.setdefault(col, kind) != kind:
+                        # Numeric in some chunks & text in others (e.g. '1' then 'x' in a CSV): the column stays
+                        # text, without categories since the values parsed as numbers weren't kept as strings
+                        mixed.add(col)
+                        stats.pop(col, None)
+                        uniques.pop(col, None)
+                        string_cols.discard(col)
+                    elif kind == 'numeric':
+                        # A column read as int in one chunk & float (NaN) in another merges into a nullable int
+                        chunk_stats = _column_stats(values)
+                        stats[col] = stats[col].merge(chunk_stats) if col in stats else chunk_stats
+                    elif uniques.get(col, set()) is not None:
+                        if values.dtype != object:
+                            string_cols.add(col)
+                        seen = uniques.setdefault(col, set())
+                        seen.update(values.dropna().unique())
+                        if len(seen) > max_categories:
+                            # Too many distinct values to become a category, stop tracking them
+                            uniques[col] = None
+
+            # Build the dtype plan
+            dtypes = {}
+            for col, col_stats in stats.items():
+                dtype = _numeric_dtype(col_stats)
+                if dtype is not None:
+                    dtypes[col] = dtype
+            for col, seen in uniques.items():
+                if seen is None:
+                    # More than max_categories unique values: high-cardinality text
+                    dtype = STRING_DTYPE if string_threshold is not None else None
+                else:
+                    dtype = _text_dtype(len(seen), n_rows, category_threshold, string_threshold)
+                if dtype == "category":
+                    # Shared categories so every chunk (and their concatenation) keeps the same dtype
+                    dtypes[col] = pd.CategoricalDtype(sorted(seen, key=str))
+                elif dtype is not None and col not in string_cols:
+                    dtypes[col] = dtype
+            for col in mixed:
+                # Read every chunk of a mixed column as text so no value becomes NaN
+                dtypes[col] = STRING_DTYPE if string_threshold is not None and STRING_DTYPE is not None else object
+
+            # Second pass: re-read every chunk with the downcast dtypes
+            chunks = list(_chunk_source(source, chunksize, dtype=dtypes, **read_kwargs)())
+        data = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        del chunks
+
+        if verbose:
+            end_mem = data.memory_usage(deep=True).sum()
+            # The optimised chunks & their concatenation coexist for a moment, hence 2x
+            two_pass_peak = max(peak_chunk_bytes, 2 * end_mem) / 1024 ** 2
+            print("Estimated peak memory: {:.2f} Mb chunked vs {:.2f} Mb naive load".format(two_pass_peak, naive_bytes / 1024 ** 2))
+            print("Mem. usage decreased to {:.2f} Mb ({:.1f}% reduction)".format(end_mem / 1024 ** 2, 100 * ((naive_bytes - end_mem) / naive_bytes) if naive_bytes else 0))
+
+        return data
+
+
+
+    #* (3) Method
+    @classmethod
+    @get_time
+    def dtype_plan(cls, data: pd.DataFrame) -> dict:
+        """
+        Describe the dtypes of an (optimised) DataFrame as a JSON-serialisable plan.
+
+        The plan can be saved and passed to optimise_mem / optimise_mem_chunked (plan=...) to cast later batches
+        sharing the same schema straight away: no statistics are computed, so every batch gets the same dtypes
+        (including the same categories) and the batches concatenate cleanly.
+
+        Parameters:
+            - data (pd.DataFrame): DataFrame whose dtypes are described, usually the output of optimise_mem.
+
+        Returns:
+            dict: {'version': 1, 'columns': [{'name': ..., 'dtype': ...}, ...]} ('categories' & 'ordered' are added for category columns).
+
+        Example usage:
+        --------------
+        ..  code-block:: python
+
+            # Import dependencies
+            import json
+            import CleanData
+
+            # Learn the dtypes on the first batch & save them
+            data = CleanData.Memory.optimise_mem(first_batch)
+            with open('plan.json', 'w') as f:
+                json.dump(CleanData.Memory.dtype_plan(data), f)
+
+            # Apply them to the daily batches
+            with open('plan.json') as f:
+                plan = json.load(f)
+            batch = CleanData.Memory.optimise_mem(batch, plan=plan)
+        """
+        # numpy scalars (e.g. np.int64 column names) aren't JSON-serialisable
+        columns = [{'name': col.item() if isinstance(col, np.generic) else col, **_dtype_spec(dtype)} for col, dtype in data.dtypes.items()]
+        return {'version': PLAN_VERSION, 'columns': columns}
@@ -1,23 +1,31 @@
 import pandas as pd  # noqa: F401
-from transformers import (AutoModelForTableQuestionAnswering,  # noqa: F401
-                          AutoTokenizer, pipeline)
 
 from ._utils import get_time
 
 
 class QA:
-    # Load model & tokenizer
-
+    # Model name; the model, tokenizer & pipeline are loaded on the first call to Ask
     model = 'google/tapas-base-finetuned-wtq'
-    tapas_model = AutoModelForTableQuestionAnswering.from_pretrained(model)
-    tapas_tokenizer = AutoTokenizer.from_pretrained(model)
-    
-    # Initializing pipeline
-    nlp = pipeline('table-question-answering', model=tapas_model, tokenizer=tapas_tokenizer)
+    tapas_model = None
+    tapas_tokenizer = None
+    nlp = None
 
     def __init__(self, data):
         self.data = data
 
+    @classmethod
+    def _load_pipeline(cls):
+        """Load the TAPAS model, tokenizer & pipeline once and cache them on the class."""
+        if cls.nlp is None:
+            # Deferred import: transformers (and torch) are only needed once a question is asked
+            from transformers import (AutoModelForTableQuestionAnswering,
+                                      AutoTokenizer, pipeline)
+
+            cls.tapas_model = AutoModelForTableQuestionAnswering.from_pretrained(cls.model)
+            cls.tapas_tokenizer = AutoTokenizer.from_pretrained(cls.model)
+            cls.nlp = pipeline('table-question-answering', model=cls.tapas_model, tokenizer=cls.tapas_tokenizer)
+        return cls.nlp
+
     @classmethod
     @get_time
     def Ask(cls, query: str, data: pd.DataFrame):
@@ -55,6 +63,8 @@ class QA:
                 CleanData.QA.Ask(query, income)
 
             Note: **I am currently working to scale this method, currently can be applied on max 256 records at a time**
+
+            Note: The TAPAS model & tokenizer are loaded on the first call to Ask and reused afterwards.
         """
 
         # Applying a string type for data
@@ -62,7 +72,7 @@ class QA:
         
         print(query)
         print('>>>>>')
-        result = cls.nlp({'table': data, 'query': query})
+        result = cls._load_pipeline()({'table': data, 'query': query})
         answer = result['cells']
         print(answer)
 
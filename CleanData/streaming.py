@@ -0,0 +1,286 @@
+# Import Dependencies
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from ._utils import _MAD_SCALE, _n_workers
+
+# Capacity ratio between consecutive KLL compactors
+_KLL_C = 2 / 3
+
+# Default threshold of each method: standard deviations, scaled MADs or IQRs away from the centre/quartiles
+THRESHOLDS = {'zscore': 3.0, 'mad': 3.0, 'iqr': 1.5}
+
+# Chunks in flight per worker, which bounds the memory of the pickled chunks
+_CHUNKS_PER_WORKER = 2
+
+
+def _weighted_quantiles(items: np.ndarray, weights: np.ndarray, qs) -> np.ndarray:
+    """Quantiles of weighted items: the first item whose cumulative weight reaches q of the total."""
+    if not len(items):
+        return np.full(len(qs), np.nan)
+    order = np.argsort(items, kind='stable')
+    items, cumulative = items[order], np.cumsum(weights[order])
+    positions = np.searchsorted(cumulative, np.asarray(qs) * cumulative[-1], side='left')
+    return items[np.minimum(positions, len(items) - 1)]
+
+
+#!############################# # Quantile sketch # ##############################
+
+class KLLSketch:
+    """Mergeable quantile sketch of a stream of numbers (Karnin, Lang & Liberty, 2016).
+
+    Values are kept in a hierarchy of compactors: when a compactor is full, its
+    sorted values are halved (every other one, from a random offset) and
+    promoted to the next compactor, where each value stands for twice as many.
+    The capacities shrink geometrically towards the lower compactors, so the
+    sketch holds O(k) values whatever the length of the stream, with a rank
+    error of about 1.7 / k. Two sketches merge by concatenating their
+    compactors level by level, so partial sketches built on different chunks
+    (or workers) combine into the sketch of the whole stream.
+
+    Parameters:
+        - k (int, optional): Capacity of the top compactor, trading memory for accuracy. Defaults to 200.
+        - seed (int, optional): Seed of the random compaction offsets. Defaults to None.
+    """
+    def __init__(self, k: int = 200, seed: int = None):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self) -> str:
+        return f"KLLSketch(k={self.k}, n={self.n:,}, retained={sum(map(len, self.levels)):,})"
+
+    def _capacity(self, level: int) -> int:
+        return max(2, int(np.ceil(self.k * _KLL_C ** (len(self.levels) - 1 - level))))
+
+    def _compress(self) -> None:
+        """Compact the compactors over capacity, lowest first, until all of them fit."""
+        full = True
+        while full:
+            full = False
+            for h in range(len(self.levels)):
+                level = self.levels[h]
+                if len(level) <= self._capacity(h):
+                    continue
+                full = True
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(level)
+                # An odd value out stays at its level, the others are halved into the next one
+                odd = len(level) % 2
+                self.levels[h] = level[:odd]
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], level[odd + self._rng.integers(2)::2]])
+
+    def update(self, values) -> 'KLLSketch':
+        """Add values to the sketch, missing values are ignored."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.n += len(values)
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        """Fold another sketch into this one."""
+        for h, level in enumerate(other.levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def items(self) -> tuple:
+        """The retained values & the number of values each one stands for."""
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        return items, weights
+
+    def quantiles(self, qs) -> np.ndarray:
+        """Approximate quantiles (0 <= q <= 1) of the values added so far."""
+        return _weighted_quantiles(*self.items(), qs)
+
+
+#!############################# # Streaming univariate outliers # ##############################
+
+def _sketch_chunk(chunk: pd.DataFrame, features: list, method: str, threshold: float, k: int, seed: int) -> 'StreamingOutliers':
+    """Partial state of a single chunk, built in a worker."""
+    return StreamingOutliers(features, method, threshold, k, seed).update(chunk)
+
+
+class StreamingOutliers:
+    """Univariate outlier bounds of every column, learned from chunks in constant memory per column.
+
+    Each column keeps its count, mean & sum of squared deviations (Welford's
+    moments, merged with Chan's formula), its min/max and a KLL quantile sketch.
+    Partial states built on different chunks, in parallel, merge into the state
+    of the whole data, from which the bounds of each method follow:
+        - 'zscore': mean +/- threshold standard deviations.
+        - 'mad': median +/- threshold scaled median absolute deviations (estimated from the sketch).
+        - 'iqr': first quartile - threshold IQR & third quartile + threshold IQR.
+    Rows are then flagged chunk by chunk, in a second pass.
+
+    Parameters:
+        - features (list, optional): Columns to track. Defaults to None (the numeric columns of the first chunk).
+        - method (str, optional): 'zscore', 'mad' or 'iqr'. Defaults to 'zscore'.
+        - threshold (float, optional): Number of standard deviations, scaled MADs or IQRs. Defaults to None (3, 3 & 1.5).
+        - k (int, optional): Size of the quantile sketches, ~1.7 / k rank error. Defaults to 200.
+        - seed (int, optional): Seed of the quantile sketches, None for non-reproducible sketches. Defaults to 0.
+
+    Example usage:
+    --------------
+    .. code-block:: python
+
+        import pandas as pd
+        import CleanData
+
+        # First pass: learn the bounds, 4 processes sketching the chunks
+        detector = CleanData.StreamingOutliers(['amount', 'duration'], method='mad')
+        detector.fit(pd.read_csv('transactions.csv', chunksize=500_000), n_jobs=4)
+        detector.bounds()
+
+        # Second pass: flag the rows of every chunk
+        for chunk in pd.read_csv('transactions.csv', chunksize=500_000):
+            flags = detector.flag(chunk)
+    """
+    def __init__(self, features: list = None, method: str = 'zscore', threshold: float = None, k: int = 200, seed: int = 0):
+        if method not in THRESHOLDS:
+            raise ValueError("Invalid value for method. Please provide 'zscore', 'mad' or 'iqr'.")
+        self.features = None if features is None else list(features)
+        self.method = method
+        self.threshold = THRESHOLDS[method] if threshold is None else threshold
+        self.k = k
+        self.seed = seed
+        self.count = self.mean = self.m2 = self.min = self.max = None
+        self.sketches = None
+
+    def __repr__(self) -> str:
+        n = 0 if self.count is None else int(self.count.max(initial=0))
+        return f"StreamingOutliers(method={self.method!r}, threshold={self.threshold}, features={self.features}, rows={n:,})"
+
+    def _init_state(self, chunk: pd.DataFrame) -> None:
+        if self.features is None:
+            self.features = [col for col, values in chunk.items()
+                             if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values)]
+        p = len(self.features)
+        self.count, self.mean, self.m2 = np.zeros(p), np.zeros(p), np.zeros(p)
+        self.min, self.max = np.full(p, np.inf), np.full(p, -np.inf)
+        self.sketches = [KLLSketch(self.k, None if self.seed is None else self.seed + i) for i in range(p)]
+
+    def _merge_moments(self, count, mean, m2) -> None:
+        """Chan's parallel update of the Welford moments of every column."""
+        total = self.count + count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean
+            self.mean = np.where(total > 0, self.mean + delta * np.divide(count, total), 0.0)
+            self.m2 = np.where(total > 0, self.m2 + m2 + delta ** 2 * np.divide(self.count * count, total), 0.0)
+        self.count = total
+
+    def update(self, chunk: pd.DataFrame) -> 'StreamingOutliers':
+        """Add a chunk of rows to the state."""
+        if self.sketches is None:
+            self._init_state(chunk)
+        X = chunk[self.features].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(X)
+        count = valid.sum(axis=0).astype(np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, np.nansum(X, axis=0) / count, 0.0)
+        m2 = np.nansum(np.square(X - mean), axis=0)
+        self._merge_moments(count, mean, m2)
+        if len(X):
+            self.min = np.fmin(self.min, np.min(np.where(valid, X, np.inf), axis=0))
+            self.max = np.fmax(self.max, np.max(np.where(valid, X, -np.inf), axis=0))
+        for i, sketch in enumerate(self.sketches):
+            sketch.update(X[:, i])
+        return self
+
+    def merge(self, other: 'StreamingOutliers') -> 'StreamingOutliers':
+        """Fold the state of other chunks (e.g. built by another worker) into this one."""
+        if other.sketches is None:
+            return self
+        if self.sketches is None:
+            self.features = other.features
+            self._init_state(pd.DataFrame(columns=other.features))
+        if other.features != self.features:
+            raise ValueError("Invalid state to merge. Please merge states tracking the same features.")
+        self._merge_moments(other.count, other.mean, other.m2)
+        self.min, self.max = np.fmin(self.min, other.min), np.fmax(self.max, other.max)
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+        return self
+
+    def fit(self, chunks, n_jobs: int = 1) -> 'StreamingOutliers':
+        """Update the state from an iterable of chunks, sketched serially or across a process pool & merged.
+
+        Every chunk is sketched on its own, with a seed derived from its position, and the partial states
+        are merged in chunk order: with a seed, serial & parallel fits give the same state (& flag the same rows).
+        """
+        n_workers = _n_workers(n_jobs)
+        args = (self.features, self.method, self.threshold, self.k)
+        if n_workers == 1:
+            for i, chunk in enumerate(chunks):
+                self.merge(_sketch_chunk(chunk, *args, self._chunk_seed(i)))
+            return self
+
+        # A bounded window of chunks is in flight, each worker returning the partial state of its chunk
+        with ProcessPoolExecutor(n_workers) as pool:
+            pending = []
+            for i, chunk in enumerate(chunks):
+                pending.append(pool.submit(_sketch_chunk, chunk, *args, self._chunk_seed(i)))
+                if len(pending) >= n_workers * _CHUNKS_PER_WORKER:
+                    self.merge(pending.pop(0).result())
+            for future in pending:
+                self.merge(future.result())
+        return self
+
+    def _chunk_seed(self, i: int) -> int:
+        """Seed of the sketches of the i-th chunk of a fit."""
+        return None if self.seed is None else self.seed + 7919 * (i + 1)
+
+    def stats(self) -> pd.DataFrame:
+        """Count, mean, std, min, max, median, scaled MAD & quartiles of every column."""
+        self._check_fitted()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(np.where(self.count > 1, self.m2 / (self.count - 1), np.nan))
+        quantiles, mads = [], []
+        for sketch in self.sketches:
+            items, weights = sketch.items()
+            q1, median, q3 = _weighted_quantiles(items, weights, [0.25, 0.5, 0.75])
+            quantiles.append((q1, median, q3))
+            mads.append(_MAD_SCALE * _weighted_quantiles(np.abs(items - median), weights, [0.5])[0])
+        q1, median, q3 = np.array(quantiles, dtype=np.float64).reshape(-1, 3).T
+        return pd.DataFrame({'count': self.count.astype(np.int64), 'mean': self.mean, 'std': std,
+                             'min': np.where(self.count > 0, self.min, np.nan), 'max': np.where(self.count > 0, self.max, np.nan),
+                             'median': median, 'mad': mads, 'q1': q1, 'q3': q3},
+                            index=pd.Index(self.features, name='column'))
+
+    def bounds(self) -> pd.DataFrame:
+        """Lower & upper bound of the inliers of every column."""
+        stats = self.stats()
+        if self.method == 'zscore':
+            lower, upper = stats['mean'] - self.threshold * stats['std'], stats['mean'] + self.threshold * stats['std']
+        elif self.method == 'mad':
+            lower, upper = stats['median'] - self.threshold * stats['mad'], stats['median'] + self.threshold * stats['mad']
+        else:
+            iqr = stats['q3'] - stats['q1']
+            lower, upper = stats['q1'] - self.threshold * iqr, stats['q3'] + self.threshold * iqr
+        return pd.DataFrame({'lower': lower, 'upper': upper})
+
+    def flag(self, chunk: pd.DataFrame, bounds: pd.DataFrame = None) -> pd.DataFrame:
+        """Boolean DataFrame flagging the values of a chunk outside the bounds (missing values are never flagged)."""
+        bounds = self.bounds() if bounds is None else bounds
+        X = chunk[self.features].to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid='ignore'):
+            flags = (X < bounds['lower'].to_numpy()) | (X > bounds['upper'].to_numpy())
+        return pd.DataFrame(flags, index=chunk.index, columns=self.features)
+
+    def _check_fitted(self) -> None:
+        if self.sketches is None:
+            raise ValueError("Invalid state. Please update the detector with at least one chunk first.")
@@ -0,0 +1,251 @@
+# Import Dependencies
+import hashlib
+import json
+import os
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+# Bumped whenever the on-disk layout of a saved index changes
+INDEX_VERSION = 1
+
+_ARRAYS = ('keys', 'word_ids', 'word_hashes', 'word_order', 'counts', 'lengths', 'offsets', 'blob')
+
+
+def _hash(strings) -> np.ndarray:
+    """Stable 64-bit hashes of strings (the same across processes, so they can be saved)."""
+    return pd.util.hash_array(np.asarray(strings, dtype=object), categorize=False)
+
+
+def _deletes(word: str, max_distance: int, prefix_length: int) -> set:
+    """Every string obtained by deleting up to max_distance characters from the prefix of a word."""
+    word = word[:prefix_length]
+    deletes = frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        deletes = deletes | frontier
+    return deletes
+
+
+def _code_points(blob: np.ndarray, starts: np.ndarray, lengths: np.ndarray, width: int) -> np.ndarray:
+    """Gather strings stored back to back in a code point array into a (n, width) matrix."""
+    columns = np.arange(width)
+    positions = np.minimum(starts[:, None] + columns, max(len(blob) - 1, 0))
+    return np.where(columns < lengths[:, None], blob[positions], 0)
+
+
+def _osa_distances(a: np.ndarray, la: np.ndarray, b: np.ndarray, lb: np.ndarray) -> np.ndarray:
+    """Optimal string alignment distance (insertions, deletions, substitutions & adjacent transpositions) of many pairs.
+
+    The dynamic programming table is filled for every pair at once, a & b hold
+    the code points of the strings row by row (padded past la & lb).
+    """
+    n, width_a = a.shape
+    width_b = b.shape[1]
+    distances = lb.astype(np.int16)  # la == 0
+    before, previous = None, np.tile(np.arange(width_b + 1, dtype=np.int16), (n, 1))
+    for i in range(1, width_a + 1):
+        current = np.empty_like(previous)
+        current[:, 0] = i
+        for j in range(1, width_b + 1):
+            cell = np.minimum(previous[:, j], current[:, j - 1]) + 1
+            np.minimum(cell, previous[:, j - 1] + (a[:, i - 1] != b[:, j - 1]), out=cell)
+            if i > 1 and j > 1:
+                swapped = (a[:, i - 1] == b[:, j - 2]) & (a[:, i - 2] == b[:, j - 1])
+                np.minimum(cell, np.where(swapped, before[:, j - 2] + 1, cell), out=cell)
+            current[:, j] = cell
+        rows = np.flatnonzero(la == i)
+        distances[rows] = current[rows, lb[rows]]
+        before, previous = previous, current
+    return distances
+
+
+#!############################# # Symmetric delete index # ##############################
+
+class SymSpellIndex:
+    """Spelling correction index built on the SymSpell symmetric delete algorithm.
+
+    Rather than generating every edit of a misspelled word at query time (as
+    SpellChecker does), every word of the vocabulary is indexed once under the
+    strings obtained by deleting up to ``max_distance`` characters from it. A
+    query only generates its own deletes, and the dictionary words sharing one
+    of them are the only candidates whose edit distance is computed. The
+    correction is the closest candidate, the most frequent one among ties,
+    like SpellChecker.correction (which breaks frequency ties arbitrarily,
+    while the index picks the first word of the vocabulary).
+
+    The index is held in flat numpy arrays (sorted 64-bit hashes of the deletes
+    & the word ids they point to), so it can be saved to a directory and loaded
+    back memory-mapped: processes sharing an index share its pages.
+
+    Parameters:
+        - words (dict or iterable of str): Vocabulary as {word: frequency}, or words with a frequency of 1. Words are indexed lowercase, the frequencies of their case variants are summed.
+        - max_distance (int, optional): Maximum edit distance of the corrections. Defaults to 2.
+        - prefix_length (int, optional): Only the first characters of the words are indexed, which keeps the index small. Defaults to 7.
+
+    Example usage:
+    --------------
+    .. code-block:: python
+
+        import CleanData
+
+        # The SpellChecker dictionary plus our own product names
+        index = CleanData.SymSpellIndex.from_spellchecker('en', words={'CleanData': 1_000, 'PyOD': 1_000})
+        index.save('symspell_en')
+
+        # Later (or in other processes): memory-map it instead of rebuilding it
+        index = CleanData.SymSpellIndex.load('symspell_en')
+        index.lookup(['engeneer', 'cleandta'])
+        CleanData.TextTypos.correct_sentence(df, 'Text', backend=index)
+    """
+    def __init__(self, words, max_distance: int = 2, prefix_length: int = 7):
+        if max_distance < 0 or prefix_length <= max_distance:
+            raise ValueError("Invalid value for max_distance/prefix_length. Please provide 0 <= max_distance < prefix_length.")
+        if not isinstance(words, dict):
+            words = dict.fromkeys(words, 1)
+        # Queries are matched lowercase, so the vocabulary is too ('CleanData' & 'cleandata' are one word)
+        lowercase = {}
+        for word, count in words.items():
+            lowercase[word.lower()] = lowercase.get(word.lower(), 0) + count
+        words = lowercase
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+
+        # Words are stored back to back as code points, so candidates are gathered without decoding them
+        vocabulary = list(words)
+        self.blob = np.frombuffer(''.join(vocabulary).encode('utf-32-le'), dtype=np.uint32)
+        self.lengths = np.fromiter(map(len, vocabulary), dtype=np.int64, count=len(vocabulary))
+        self.offsets = np.concatenate([[0], np.cumsum(self.lengths)]).astype(np.int64)
+        self.counts = np.fromiter(words.values(), dtype=np.int64, count=len(vocabulary))
+
+        word_hashes = _hash(vocabulary)
+        self.word_order = np.argsort(word_hashes).astype(np.int32)
+        self.word_hashes = word_hashes[self.word_order]
+
+        # One (hash of delete, word id) entry per delete of every word, sorted by hash
+        deletes = [_deletes(word, max_distance, prefix_length) for word in vocabulary]
+        keys = _hash(list(chain.from_iterable(deletes)))
+        word_ids = np.repeat(np.arange(len(vocabulary), dtype=np.int32), [len(d) for d in deletes])
+        order = np.argsort(keys, kind='stable')
+        self.keys, self.word_ids = keys[order], word_ids[order]
+
+        digest = hashlib.sha1(self.blob.tobytes())
+        digest.update(self.counts.tobytes())
+        digest.update(f'{max_distance}:{prefix_length}'.encode())
+        self.vocabulary_id = digest.hexdigest()[:16]
+
+    @classmethod
+    def from_spellchecker(cls, language: str = 'en', words=None, max_distance: int = 2, prefix_length: int = 7) -> 'SymSpellIndex':
+        """Index the SpellChecker word frequency list of a language, plus custom words (added or overriding frequencies)."""
+        from spellchecker import SpellChecker
+
+        vocabulary = dict(SpellChecker(language=language, distance=1).word_frequency.dictionary)
+        if words is not None:
+            vocabulary.update(words if isinstance(words, dict) else dict.fromkeys(words, 1))
+        return cls(vocabulary, max_distance, prefix_length)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __repr__(self) -> str:
+        return (f"SymSpellIndex(words={len(self):,}, deletes={len(self.keys):,}, max_distance={self.max_distance}, "
+                f"prefix_length={self.prefix_length})")
+
+    def word(self, i: int) -> str:
+        """Decode the i-th word of the vocabulary."""
+        return np.asarray(self.blob[self.offsets[i]:self.offsets[i + 1]]).tobytes().decode('utf-32-le')
+
+    def _find(self, words: list) -> np.ndarray:
+        """Word id of each (lowercase) word, -1 when it isn't in the vocabulary."""
+        hashes = _hash(words)
+        positions = np.minimum(np.searchsorted(self.word_hashes, hashes), len(self.word_hashes) - 1)
+        ids = np.where(self.word_hashes[positions] == hashes, self.word_order[positions], -1)
+        # Hashes match, make sure the words do too
+        return np.array([i if i >= 0 and self.word(i) == word else -1 for i, word in zip(ids, words)], dtype=np.int64)
+
+    def known(self, tokens) -> np.ndarray:
+        """Boolean array flagging the tokens of the vocabulary (case insensitive)."""
+        return self._find([token.lower() for token in tokens]) >= 0
+
+    def lookup(self, tokens) -> list:
+        """Most likely correction of every token, None when no word is within max_distance."""
+        queries = [token.lower() for token in tokens]
+        corrections = [None] * len(queries)
+
+        # Words of the vocabulary are their own correction
+        ids = self._find(queries)
+        for q in np.flatnonzero(ids >= 0):
+            corrections[q] = queries[q]
+        todo = np.flatnonzero(ids < 0)
+        if not len(todo) or not self.max_distance:
+            return corrections
+
+        # Words sharing a delete with a query are its candidates, fetched for every query at once
+        deletes = [_deletes(queries[q], self.max_distance, self.prefix_length) for q in todo]
+        hashes = _hash(list(chain.from_iterable(deletes)))
+        owners = np.repeat(todo, [len(d) for d in deletes])
+        left = np.searchsorted(self.keys, hashes, side='left')
+        sizes = np.searchsorted(self.keys, hashes, side='right') - left
+        starts = np.repeat(left - np.concatenate([[0], np.cumsum(sizes)[:-1]]), sizes)
+        candidates = np.asarray(self.word_ids[starts + np.arange(sizes.sum())], dtype=np.int64)
+        owners = np.repeat(owners, sizes)
+
+        # Drop duplicated pairs & the words whose length alone rules them out
+        pairs = np.unique((owners << 32) | candidates)
+        owners, candidates = pairs >> 32, pairs & 0xFFFFFFFF
+        query_lengths = np.fromiter(map(len, queries), dtype=np.int64, count=len(queries))
+        close = np.abs(self.lengths[candidates] - query_lengths[owners]) <= self.max_distance
+        owners, candidates = owners[close], candidates[close]
+
+        distances = self._distances(queries, owners, candidates)
+        within = distances <= self.max_distance
+        owners, candidates, distances = owners[within], candidates[within], distances[within]
+
+        # Closest candidate first, then the most frequent one (ties broken by vocabulary order)
+        order = np.lexsort((candidates, -self.counts[candidates], distances, owners))
+        owners, candidates = owners[order], candidates[order]
+        first = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]]) if len(owners) else owners
+        for q, c in zip(owners[first], candidates[first]):
+            corrections[q] = self.word(c)
+        return corrections
+
+    def _distances(self, queries: list, owners: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """Edit distance between every (query, candidate word) pair, computed per query length."""
+        query_blob = np.frombuffer(''.join(queries).encode('utf-32-le'), dtype=np.uint32)
+        query_lengths = np.fromiter(map(len, queries), dtype=np.int64, count=len(queries))
+        query_offsets = np.concatenate([[0], np.cumsum(query_lengths)[:-1]]).astype(np.int64)
+
+        distances = np.empty(len(owners), dtype=np.int16)
+        pair_lengths = query_lengths[owners]
+        for length in np.unique(pair_lengths):
+            pairs = np.flatnonzero(pair_lengths == length)
+            la, lb = pair_lengths[pairs], self.lengths[candidates[pairs]]
+            a = _code_points(query_blob, query_offsets[owners[pairs]], la, int(length))
+            b = _code_points(self.blob, self.offsets[candidates[pairs]], lb, int(lb.max()))
+            distances[pairs] = _osa_distances(a, la, b, lb)
+        return distances
+
+    def save(self, path) -> None:
+        """Save the index to a directory of .npy files (plus its settings in index.json)."""
+        os.makedirs(path, exist_ok=True)
+        for name in _ARRAYS:
+            np.save(os.path.join(path, f'{name}.npy'), getattr(self, name))
+        with open(os.path.join(path, 'index.json'), 'w') as f:
+            json.dump({'version': INDEX_VERSION, 'max_distance': self.max_distance,
+                       'prefix_length': self.prefix_length, 'vocabulary_id': self.vocabulary_id}, f)
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> 'SymSpellIndex':
+        """Load an index saved with save(), memory-mapping its arrays unless mmap=False."""
+        with open(os.path.join(path, 'index.json')) as f:
+            settings = json.load(f)
+        if settings.get('version') != INDEX_VERSION:
+            raise ValueError(f"Invalid index version {settings.get('version')!r}. Please rebuild the index with version {INDEX_VERSION}.")
+        index = cls.__new__(cls)
+        index.max_distance = settings['max_distance']
+        index.prefix_length = settings['prefix_length']
+        index.vocabulary_id = settings['vocabulary_id']
+        for name in _ARRAYS:
+            setattr(index, name, np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r' if mmap else None))
+        return index
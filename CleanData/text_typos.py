@@ -1,24 +1,617 @@
 
 # Import Dependencies
+import os
+import re
+import sqlite3
+import unicodedata
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from time import perf_counter, time
+
+import numpy as np
 import pandas as pd
 from spellchecker import SpellChecker
 
-from ._utils import get_time
+from ._utils import _n_workers, get_time
+from .memory import _column_stats, _float_dtype, _numeric_dtype
+from .symspell import SymSpellIndex
 
+# Marks a token absent from the cache (None is a valid correction: no candidate found)
+_MISSING = object()
+
+# Number of tokens bound per SQLite query (older SQLite builds cap a statement at 999 variables)
+_SQLITE_BATCH = 900
+
+# Leading punctuation, core word & trailing punctuation of a token ('"Hello,' -> '"', 'Hello', ',')
+_TOKEN_PATTERN = re.compile(r'([\W_]*)(.*?)([\W_]*)', re.DOTALL)
+
+# Runs of whitespace, for Python's re & for pyarrow's RE2 (whose \s is ASCII only) matching the same characters
+_WHITESPACE = re.compile(r'\s+')
+_ARROW_WHITESPACE = r'[\s\v\x1c-\x1f\x85\p{Z}]+'
+
+# Currency symbols dropped when parsing numbers ('$1,200' -> 1200)
+CURRENCY_SYMBOLS = '$€£¥₹₩₽¢₺₪฿'
+
+# Plain integers & decimal numbers, validated before casting arrow strings (a failed cast raises rather than coercing)
+_ARROW_INTEGER = r'^[+-]?\d{1,18}$'
+_ARROW_NUMBER = r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$'
+
+# Text columns with at most this fraction of distinct values are processed on their unique values only
+LOW_CARDINALITY = 0.5
+
+# Number of failed values kept per column in the object_to_numeric report
+_FAILURE_SAMPLES = 5
+
+# Below this many tokens per worker, starting a process (and loading its dictionary) costs more than it saves
+_MIN_TOKENS_PER_JOB = 256
+
+
+@lru_cache(maxsize=None)
+def _spell_checker(language: str = 'en', distance: int = 2) -> SpellChecker:
+    """Load the word frequency list once per (language, distance) rather than once per call."""
+    return SpellChecker(language=language, distance=distance)
+
+
+#!############################# # Spelling correction cache # ##############################
+
+class CorrectionCache:
+    """Bounded LRU cache of spelling corrections shared across calls & columns.
+
+    Corrections are keyed by the spell checker settings (language, distance) and
+    the token, so the same cache can serve every column of every DataFrame. Once
+    ``maxsize`` entries are stored the least recently used ones are evicted.
+
+    Parameters:
+        - maxsize (int, optional): Maximum number of cached corrections, None for unbounded. Defaults to 100_000.
+
+    Example usage:
+    --------------
+    .. code-block:: python
+
+        import CleanData
+
+        # Corrections are cached in TextTypos.cache by default
+        CleanData.TextTypos.correct_word(df, 'Occupation')
+        CleanData.TextTypos.cache.hits, CleanData.TextTypos.cache.misses
+
+        # Or pass a dedicated cache to a single call
+        cache = CleanData.CorrectionCache(maxsize=10_000)
+        CleanData.TextTypos.correct_sentence(df, 'Text', cache=cache)
+    """
+    def __init__(self, maxsize: int = 100_000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"CorrectionCache(maxsize={self.maxsize}, size={len(self)}, hits={self.hits}, misses={self.misses})"
+
+    def get_many(self, namespace: tuple, tokens: np.ndarray) -> tuple:
+        """Look tokens up, returning (corrections, positions of the tokens that missed)."""
+        corrections = np.empty(len(tokens), dtype=object)
+        missing = []
+        for i, token in enumerate(tokens):
+            key = (namespace, token)
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                missing.append(i)
+            else:
+                self._data.move_to_end(key)
+                corrections[i] = value
+        self.hits += len(tokens) - len(missing)
+        self.misses += len(missing)
+        return corrections, np.array(missing, dtype=np.intp)
+
+    def put_many(self, namespace: tuple, tokens, corrections) -> None:
+        """Store corrections, evicting the least recently used ones beyond maxsize."""
+        for token, correction in zip(tokens, corrections):
+            self._data[(namespace, token)] = correction
+            self._data.move_to_end((namespace, token))
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached correction and reset the hit/miss counters."""
+        self._data.clear()
+        self.hits = self.misses = 0
+
+
+class PersistentCorrectionCache(CorrectionCache):
+    """Spelling corrections persisted to a SQLite file, so later runs only correct unseen tokens.
+
+    Corrections are keyed by (language, distance, token) and stamped with their
+    last use, so once the file holds ``maxsize`` corrections the least recently
+    used ones are evicted. It is a drop-in replacement for CorrectionCache.
+
+    Parameters:
+        - path (str or PathLike): SQLite file holding the corrections, created if missing.
+        - maxsize (int, optional): Maximum number of stored corrections, None for unbounded. Defaults to 1_000_000.
+
+    Example usage:
+    --------------
+    .. code-block:: python
+
+        import CleanData
+
+        # Tonight's run reuses every correction computed by the previous ones
+        cache = CleanData.PersistentCorrectionCache('corrections.db')
+        CleanData.TextTypos.correct_sentence(df, 'Text', cache=cache)
+        cache.hits, cache.misses
+
+        # Or make it the default cache of every TextTypos call
+        CleanData.TextTypos.cache = cache
+    """
+    def __init__(self, path, maxsize: int = 1_000_000):
+        super().__init__(maxsize)
+        self.path = os.fspath(path)
+        self._connection = sqlite3.connect(self.path)
+        with self._connection:
+            self._connection.executescript("""
+                PRAGMA journal_mode = WAL;
+                CREATE TABLE IF NOT EXISTS corrections (
+                    language TEXT NOT NULL,
+                    distance INTEGER NOT NULL,
+                    token TEXT NOT NULL,
+                    correction TEXT,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (language, distance, token)
+                );
+                CREATE INDEX IF NOT EXISTS corrections_last_used ON corrections (last_used);
+            """)
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM corrections").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return (f"PersistentCorrectionCache(path={self.path!r}, maxsize={self.maxsize}, size={len(self)}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+    def get_many(self, namespace: tuple, tokens: np.ndarray) -> tuple:
+        """Look tokens up, returning (corrections, positions of the tokens that missed)."""
+        language, distance = namespace
+        found = {}
+        for start in range(0, len(tokens), _SQLITE_BATCH):
+            batch = tokens[start:start + _SQLITE_BATCH].tolist()
+            found.update(self._connection.execute(
+                "SELECT token, correction FROM corrections WHERE language = ? AND distance = ? "
+                f"AND token IN ({', '.join('?' * len(batch))})", (language, distance, *batch)))
+
+        corrections = np.empty(len(tokens), dtype=object)
+        missing = []
+        for i, token in enumerate(tokens):
+            value = found.get(token, _MISSING)
+            if value is _MISSING:
+                missing.append(i)
+            else:
+                corrections[i] = value
+        # Refresh the hits so they're the last to be evicted
+        now = time()
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE corrections SET last_used = ? WHERE language = ? AND distance = ? AND token = ?",
+                ((now, language, distance, token) for token in found))
+        self.hits += len(tokens) - len(missing)
+        self.misses += len(missing)
+        return corrections, np.array(missing, dtype=np.intp)
+
+    def put_many(self, namespace: tuple, tokens, corrections) -> None:
+        """Store corrections, evicting the least recently used ones beyond maxsize."""
+        language, distance = namespace
+        now = time()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO corrections VALUES (?, ?, ?, ?, ?)",
+                ((language, distance, token, correction, now) for token, correction in zip(tokens, corrections)))
+            if self.maxsize is not None:
+                excess = len(self) - self.maxsize
+                if excess > 0:
+                    self._connection.execute(
+                        "DELETE FROM corrections WHERE rowid IN "
+                        "(SELECT rowid FROM corrections ORDER BY last_used LIMIT ?)", (excess,))
+
+    def clear(self) -> None:
+        """Delete every stored correction and reset the hit/miss counters."""
+        with self._connection:
+            self._connection.execute("DELETE FROM corrections")
+        self.hits = self.misses = 0
+
+    def close(self) -> None:
+        """Close the connection to the SQLite file."""
+        self._connection.close()
+
+
+def _init_worker(language: str, distance: int) -> None:
+    """Process pool initializer: load the worker's SpellChecker once, before its first task."""
+    _spell_checker(language, distance)
+
+
+def _correct_chunk(tokens: list, language: str, distance: int) -> tuple:
+    """Correct a chunk of tokens in a worker, returning (corrections, worker pid, seconds spent)."""
+    start = perf_counter()
+    spell = _spell_checker(language, distance)
+    return [spell.correction(token) for token in tokens], os.getpid(), perf_counter() - start
+
+
+def _compute_corrections(tokens: np.ndarray, language: str, distance: int, n_jobs: int = 1, verbose: bool = False) -> list:
+    """Run the spell checker on tokens, serially or split across a process pool."""
+    n_workers = _n_workers(n_jobs, len(tokens) // _MIN_TOKENS_PER_JOB)
+    if n_workers == 1:
+        spell = _spell_checker(language, distance)
+        return [spell.correction(token) for token in tokens]
+
+    # Strided chunks spread the expensive (unknown) tokens evenly, a few chunks per worker for load balancing
+    n_chunks = min(len(tokens), n_workers * 4)
+    corrections = np.empty(len(tokens), dtype=object)
+    worker_tokens, worker_seconds = defaultdict(int), defaultdict(float)
+    with ProcessPoolExecutor(n_workers, initializer=_init_worker, initargs=(language, distance)) as pool:
+        futures = {pool.submit(_correct_chunk, tokens[i::n_chunks].tolist(), language, distance): i for i in range(n_chunks)}
+        done = reported = 0
+        for future in as_completed(futures):
+            chunk, pid, seconds = future.result()
+            i = futures[future]
+            corrections[i::n_chunks] = chunk
+            worker_tokens[pid] += len(chunk)
+            worker_seconds[pid] += seconds
+            done += len(chunk)
+            # Report progress every 10% whatever the number of chunks
+            if verbose and done * 10 // len(tokens) > reported:
+                reported = done * 10 // len(tokens)
+                print(f"Corrected {done:,}/{len(tokens):,} unique tokens with {n_workers} processes ({done / len(tokens):.0%})")
+    if verbose:
+        for pid in sorted(worker_tokens):
+            print(f"  worker {pid}: {worker_tokens[pid]:,} tokens in {worker_seconds[pid]:.2f} seconds")
+    return corrections.tolist()
+
+
+@lru_cache(maxsize=None)
+def _dictionary(language: str = 'en', distance: int = 2) -> pd.Index:
+    """Words of the SpellChecker dictionary as an Index, whose hash table is built once and reused."""
+    return pd.Index(list(_spell_checker(language, distance).word_frequency.dictionary), dtype=object)
+
+
+@lru_cache(maxsize=None)
+def _symspell_index(language: str = 'en', distance: int = 2) -> SymSpellIndex:
+    """Symmetric delete index of the SpellChecker dictionary, built once per (language, distance)."""
+    return SymSpellIndex.from_spellchecker(language, max_distance=distance)
+
+
+def _resolve_backend(backend, language: str, distance: int):
+    """The SymSpellIndex correcting the tokens, None for SpellChecker."""
+    if isinstance(backend, SymSpellIndex):
+        return backend
+    if backend == 'pyspellchecker':
+        return None
+    if backend == 'symspell':
+        return _symspell_index(language, distance)
+    raise ValueError("Invalid value for backend. Please provide 'pyspellchecker', 'symspell' or a SymSpellIndex.")
+
+
+def _needs_correction(tokens: np.ndarray, language: str = 'en', distance: int = 2, index: SymSpellIndex = None) -> np.ndarray:
+    """Flag the tokens that have to go through the spell checker's edit-distance search.
+
+    Dictionary words are returned as they are by SpellChecker.correction, and
+    numbers, punctuation-only tokens & tokens containing digits are left as they
+    are, so only the remaining (unknown) tokens need a correction.
+    """
+    text = pd.Series(tokens, dtype=object)
+    lower = text.str.lower()
+    if index is None:
+        known = _dictionary(language, distance).get_indexer(lower) >= 0
+    else:
+        known = np.zeros(len(text), dtype=bool)
+        strings = lower.notna().to_numpy()
+        known[strings] = index.known(lower[strings].tolist())
+    skip = text.str.contains(r'\d', na=True) | text.str.fullmatch(r'[\W_]*', na=True)
+    return ~known & ~skip.to_numpy(dtype=bool)
+
+
+def _correct_tokens(tokens: np.ndarray, cache: CorrectionCache, language: str = 'en', distance: int = 2,
+                    n_jobs: int = 1, verbose: bool = False, index: SymSpellIndex = None) -> tuple:
+    """Correct an array of unique tokens, only running the spell checker on unknown tokens missing from the cache.
+
+    Returns:
+        (np.ndarray, np.ndarray): The corrections & the mask of the tokens that needed one
+    """
+    corrections = tokens.copy()
+    unknown = _needs_correction(tokens, language, distance, index)
+    if unknown.any():
+        # SymSpell corrections depend on the indexed vocabulary rather than on the language
+        namespace = (language, distance) if index is None else (f'symspell:{index.vocabulary_id}', index.max_distance)
+        to_correct = tokens[unknown]
+        found, missing = cache.get_many(namespace, to_correct)
+        if len(missing):
+            if index is None:
+                computed = _compute_corrections(to_correct[missing], language, distance, n_jobs, verbose)
+            else:
+                computed = index.lookup(to_correct[missing].tolist())
+            found[missing] = computed
+            cache.put_many(namespace, to_correct[missing], computed)
+        corrections[unknown] = found
+    return corrections, unknown
+
+
+def _correction_report(codes: np.ndarray, unknown: np.ndarray, verbose: bool, weights: np.ndarray = None) -> dict:
+    """Summarise how many of the (non-missing) tokens needed a correction, each token counted weights times."""
+    found = codes >= 0
+    weights = np.ones(len(codes), dtype=np.int64) if weights is None else np.asarray(weights, dtype=np.int64)
+    codes, weights = codes[found], weights[found]
+    n_tokens = int(weights.sum())
+    n_to_correct = int(weights[unknown[codes]].sum())
+    report = {
+        'tokens': n_tokens,
+        'unique_tokens': len(unknown),
+        'unique_to_correct': int(unknown.sum()),
+        'needed_correction': n_to_correct / n_tokens if n_tokens else 0.0,
+    }
+    if verbose:
+        print(f"{report['needed_correction']:.1%} of the {report['tokens']:,} tokens "
+              f"({report['unique_to_correct']:,} of {report['unique_tokens']:,} unique) needed correction")
+    return report
+
+def _split_sentences(sentences: pd.Series) -> tuple:
+    """Split sentences on single spaces into one flat token array kept as factorized codes.
+
+    Returns:
+        (np.ndarray, np.ndarray, np.ndarray): The codes of the tokens, the unique tokens & the offsets of each sentence's tokens
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        split = sentences.str.split(' ')
+        codes, uniques = pd.factorize(split.explode().to_numpy())
+        return codes, np.asarray(uniques, dtype=object), np.concatenate([[0], np.cumsum(split.str.len().to_numpy())])
+
+    # Arrow splits every sentence at once into a single list array (values + offsets)
+    lists = pc.split_pattern(pa.array(sentences.to_numpy(dtype=object), type=pa.large_string()), ' ')
+    encoded = pc.dictionary_encode(lists.flatten())
+    return (encoded.indices.to_numpy(), np.asarray(encoded.dictionary.to_pylist(), dtype=object),
+            lists.offsets.to_numpy())
+
+
+def _join_sentences(codes: np.ndarray, tokens: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Rebuild the sentences from the token codes & offsets returned by _split_sentences, with new unique tokens."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        flat = tokens[codes].tolist()
+        offsets = offsets.tolist()
+        return np.array([' '.join(flat[start:end]) for start, end in zip(offsets[:-1], offsets[1:])], dtype=object)
+
+    flat = pa.array(tokens.tolist(), type=pa.large_string()).take(pa.array(codes))
+    lists = pa.ListArray.from_arrays(pa.array(offsets, type=pa.int32()), flat)
+    return pc.binary_join(lists, pa.scalar(' ', pa.large_string())).to_numpy(zero_copy_only=False)
+
+
+def _split_punctuation(tokens: np.ndarray) -> tuple:
+    """Split unique tokens into leading punctuation, core word & trailing punctuation."""
+    parts = [_TOKEN_PATTERN.fullmatch(token).groups() for token in tokens]
+    leads, cores, trails = zip(*parts) if parts else ((), (), ())
+    return list(leads), list(cores), list(trails)
+
+
+def _restore_token(lead: str, core: str, trail: str, correction) -> str:
+    """Put a corrected core back between its punctuation, with the casing of the original core."""
+    if correction is None or correction == core.lower():
+        return lead + core + trail
+    if len(core) > 1 and core.isupper():
+        correction = correction.upper()
+    elif core[:1].isupper():
+        correction = correction[:1].upper() + correction[1:]
+    return lead + correction + trail
+
+
+def _is_text(values: pd.Series) -> bool:
+    """Object, string & category (of strings) columns hold text, unlike bool, datetime or numeric ones."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return pd.api.types.is_string_dtype(values.cat.categories.dtype)
+    return pd.api.types.is_string_dtype(values.dtype)
+
+
+def _is_arrow_text(dtype) -> bool:
+    """Arrow-backed strings, normalised with pyarrow compute kernels."""
+    return (isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow') or \
+        (isinstance(dtype, pd.ArrowDtype) and dtype.kind in 'OU')
+
+
+def _factorize_text(values: pd.Series, max_fraction: float = LOW_CARDINALITY) -> tuple:
+    """Codes (-1 for missing values) & unique values of a category or low-cardinality column.
+
+    Returns:
+        (np.ndarray, pd.Series): The codes & the unique values, (None, None) when there are too many unique values to be worth it
+        or when some values (lists, dicts, ...) can't be hashed, in which case the column is processed row by row
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), pd.Series(values.cat.categories)
+    try:
+        codes, uniques = pd.factorize(values)
+    except TypeError:
+        return None, None
+    if len(uniques) > max_fraction * len(values):
+        return None, None
+    return codes, pd.Series(uniques)
+
+
+def _broadcast_uniques(values: pd.Series, codes: np.ndarray, results: pd.Series) -> pd.Series:
+    """Map the results computed on the unique values of a column back to its rows.
+
+    Text results of a category column stay a category column, the categories
+    whose results are equal ('A ' & 'a' once lowered) being merged.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype) and _is_text(results):
+        mapping, merged = pd.factorize(results)
+        categories = pd.Categorical.from_codes(np.append(mapping, -1)[codes], merged, ordered=values.cat.ordered)
+        return pd.Series(categories, index=values.index, name=values.name)
+    if pd.api.types.is_numeric_dtype(results.dtype) and not isinstance(results.dtype, pd.api.extensions.ExtensionDtype):
+        taken = pd.api.extensions.take(results.to_numpy(), codes, allow_fill=True)
+    else:
+        taken = results.array.take(codes, allow_fill=True)
+    return pd.Series(taken, index=values.index, name=values.name, dtype=taken.dtype)
+
+
+def _corrected_frame(values: pd.Series, codes: np.ndarray, corrections: np.ndarray) -> pd.DataFrame:
+    """Map the corrections of the unique values back to the rows, missing values are kept as they are."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return _broadcast_uniques(values, codes, pd.Series(corrections, dtype=object)).to_frame(values.name)
+    corrected = values.to_numpy(dtype=object, copy=True)
+    found = codes >= 0
+    corrected[found] = corrections[codes[found]]
+    return pd.DataFrame({values.name: corrected}, index=values.index)
+
+
+def _normalise_strings(values: np.ndarray, normalize_unicode: bool = False, collapse_whitespace: bool = False) -> np.ndarray:
+    """Lower & strip the strings of an object array in a single pass, other values are kept as they are."""
+    def normalise(text: str) -> str:
+        if normalize_unicode:
+            text = unicodedata.normalize('NFKC', text)
+        if collapse_whitespace:
+            text = _WHITESPACE.sub(' ', text)
+        return text.lower().strip()
+
+    return np.array([normalise(value) if isinstance(value, str) else value for value in values], dtype=object)
+
+
+def _normalise_arrow(values: pd.Series, normalize_unicode: bool = False, collapse_whitespace: bool = False):
+    """Lower & strip arrow-backed strings with pyarrow compute kernels, keeping the dtype."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    array = pa.array(values.array)
+    if normalize_unicode:
+        array = pc.utf8_normalize(array, 'NFKC')
+    if collapse_whitespace:
+        array = pc.replace_substring_regex(array, _ARROW_WHITESPACE, ' ')
+    return pd.array(pc.utf8_trim_whitespace(pc.utf8_lower(array)), dtype=values.dtype)
+
+
+def _normalise_column(values: pd.Series, normalize_unicode: bool = False, collapse_whitespace: bool = False) -> pd.Series:
+    """Lower & strip a text column, touching only the unique values of a category or low-cardinality column."""
+    codes, uniques = _factorize_text(values)
+    if codes is not None:
+        return _broadcast_uniques(values, codes, _normalise_values(uniques, normalize_unicode, collapse_whitespace))
+    return _normalise_values(values, normalize_unicode, collapse_whitespace)
+
+
+def _normalise_values(values: pd.Series, normalize_unicode: bool = False, collapse_whitespace: bool = False) -> pd.Series:
+    """Lower & strip every value of an object or string column."""
+    if _is_arrow_text(values.dtype):
+        return pd.Series(_normalise_arrow(values, normalize_unicode, collapse_whitespace), index=values.index,
+                         name=values.name)
+    normalised = _normalise_strings(values.to_numpy(dtype=object), normalize_unicode, collapse_whitespace)
+    return pd.Series(normalised, index=values.index, name=values.name, dtype=values.dtype)
+
+
+def _to_numeric(text: pd.Series) -> pd.Series:
+    """pd.to_numeric(errors='coerce'), parsed by pyarrow kernels (which release the GIL) for arrow-backed strings."""
+    if not _is_arrow_text(text.dtype):
+        return pd.to_numeric(text, errors='coerce')
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    array = pa.array(text.array)
+    if not array.null_count and pc.all(pc.match_substring_regex(array, _ARROW_INTEGER)).as_py():
+        return pd.Series(pc.cast(array, pa.int64()).to_numpy(), index=text.index, name=text.name)
+    valid = pc.match_substring_regex(array, _ARROW_NUMBER)
+    numbers = pc.cast(pc.if_else(valid, array, pa.scalar(None, array.type)), pa.float64())
+    return pd.Series(numbers.to_numpy(zero_copy_only=False), index=text.index, name=text.name)
+
+
+def _parse_text(values: pd.Series, thousands: str = ',', decimal: str = '.') -> tuple:
+    """Parse formatted numbers ('$1,200.50', '12.5%', '(300)') with vectorized string operations.
+
+    Returns:
+        (pd.Series, np.ndarray): The numbers & the mask of the values that couldn't be parsed
+    """
+    text = values.astype(str).str.strip()
+    negative = (text.str.startswith('(') & text.str.endswith(')')).to_numpy(dtype=bool, na_value=False)
+    # The percent sign can sit inside the accounting parentheses ('(12%)' is -0.12)
+    percent = text.str.rstrip(')').str.rstrip().str.endswith('%').to_numpy(dtype=bool, na_value=False)
+
+    # Currency symbols, percent signs, accounting parentheses, thousand separators & whitespace all go in one pass
+    removed = re.escape(CURRENCY_SYMBOLS + '%()' + (thousands or ''))
+    cleaned = text.str.replace(f'[{removed}\\s]', '', regex=True)
+    if decimal != '.':
+        cleaned = cleaned.str.replace(decimal, '.', regex=False)
+    numbers = _to_numeric(cleaned)
+    if percent.any():
+        numbers = numbers.where(~percent, numbers / 100)
+    if negative.any():
+        numbers = numbers.where(~negative, -numbers)
+
+    # Missing & blank values aren't failures, anything else that became NaN is
+    failed = (numbers.isna() & values.notna() & text.ne('')).to_numpy(dtype=bool, na_value=False)
+    return numbers, failed
+
+
+def _parse_numeric(values: pd.Series, thousands: str = ',', decimal: str = '.', downcast: bool = True) -> tuple:
+    """Parse a column of formatted numbers, only parsing the unique values of a category or low-cardinality column.
+
+    Returns:
+        (pd.Series, int, list): The numbers, the number of values that couldn't be parsed & a sample of them
+    """
+    if _is_text(values):
+        codes, uniques = _factorize_text(values)
+        if codes is None:
+            numbers, failed = _parse_text(values, thousands, decimal)
+            # Failed values are compared as text since they may not be hashable (lists, dicts, ...)
+            n_failed, samples = int(failed.sum()), values[failed].astype(str).unique()[:_FAILURE_SAMPLES].tolist()
+        else:
+            numbers, failed = _parse_text(uniques, thousands, decimal)
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            n_failed, samples = int(counts[failed].sum()), uniques[failed & (counts > 0)][:_FAILURE_SAMPLES].tolist()
+            numbers = _broadcast_uniques(values, codes, numbers)
+    else:
+        numbers, n_failed, samples = pd.to_numeric(values, errors='coerce'), 0, []
+
+    if downcast and pd.api.types.is_numeric_dtype(numbers) and not pd.api.types.is_bool_dtype(numbers):
+        # Integers get the narrowest (nullable) integer dtype, floats only go to float32 when it is lossless
+        stats = _column_stats(numbers)
+        dtype = _numeric_dtype(stats)
+        if dtype is not None and dtype.kind == 'f':
+            # Decimals, and whole numbers too large for every integer dtype, are checked for precision loss too
+            dtype = _float_dtype(numbers, stats, 0.0, 0.0)[0]
+        if dtype == np.float16:
+            dtype = np.dtype(np.float32)  # like optimise_mem, float16 is too limited to be worth it
+        if dtype is not None and dtype != numbers.dtype:
+            numbers = numbers.astype(dtype)
+    return numbers, n_failed, samples
+
+
+#!############################# # Text typos subclass # ##############################
 
 class TextTypos:
+    # Spelling corrections shared by correct_word & correct_sentence
+    cache = CorrectionCache()
+
     def __init__(self, data: pd.DataFrame):
         self.data = data
     
     #* (1) Method
     @classmethod
     @get_time
-    def strip_and_lower_strings(cls, data: pd.DataFrame) -> pd.DataFrame: 
+    def strip_and_lower_strings(cls, data: pd.DataFrame, normalize_unicode: bool = False,
+                                collapse_whitespace: bool = False) -> pd.DataFrame:
         """
         Strip whitespace and convert strings to lowercase in DataFrame.
 
+        Every text column (object, string & category) is normalised in a single
+        pass: arrow-backed strings with pyarrow compute kernels and object
+        columns value by value, leaving non-string values (numbers, lists, ...)
+        as they are. Category & low-cardinality columns (at most LOW_CARDINALITY
+        of distinct values) only have their unique values normalised, the codes
+        being remapped, so category columns stay category columns.
+
         Parameters:
             - data (pd.DataFrame): Input DataFrame containing string columns.
+            - normalize_unicode (bool, optional): Apply Unicode NFKC normalization first (full-width & ligature characters, non-breaking spaces, ...). Defaults to False.
+            - collapse_whitespace (bool, optional): Replace every run of whitespace inside the strings by a single space. Defaults to False.
 
         Returns:
             pd.DataFrame: DataFrame with strings stripped of leading/trailing whitespace and converted to lowercase.
@@ -53,26 +646,41 @@ class TextTypos:
             # Lower case the data & strip whitespaces
             CleanData.text_typos.TextTypos.strip_and_lower_strings(occupation_df_eval).values
         """   
-        for col in data.select_dtypes(exclude="number").columns:
-            data[col] = data[col].str.lower()
-            if data[col].str.startswith(" ").any() or data[col].str.endswith(" ").any():
-                data[col] = data[col].str.strip()
+        for col in data.columns[[_is_text(values) for _, values in data.items()]].unique():
+            data[col] = _normalise_column(data[col], normalize_unicode, collapse_whitespace)
         return data
 
     
     #* (2) Method 
     @classmethod
     @get_time
-    def object_to_numeric(cls,df:pd.DataFrame, features: list) -> pd.DataFrame:
+    def object_to_numeric(cls, df: pd.DataFrame, features: list = None, thousands: str = ',', decimal: str = '.',
+                          downcast: bool = True, n_jobs: int = 1, verbose: bool = True,
+                          return_report: bool = False) -> pd.DataFrame:
         """
         Convert specified columns from object type to numeric type.
 
+        Formatted numbers are parsed with vectorized string operations: currency
+        symbols, thousand separators, whitespace & percent signs are removed in a
+        single pass ('12.5%' becomes 0.125, '(300)' becomes -300), the locale
+        decimal separator is replaced, and every column is then downcast to the
+        narrowest dtype holding its values exactly. Values that can't be parsed
+        become NaN and are counted per column. Category & low-cardinality
+        columns only have their unique values parsed.
+
         Parameters:
             - df (pd.DataFrame): Input DataFrame containing columns to be converted.
-            - features (list): List of column names to be converted to numeric type.
+            - features (list, optional): List of column names to be converted to numeric type. Defaults to None (every text column).
+            - thousands (str, optional): Thousands separator removed before parsing, None to keep it. Defaults to ','.
+            - decimal (str, optional): Decimal separator (',' for most European locales). Defaults to '.'.
+            - downcast (bool, optional): Downcast to the narrowest integer dtype (nullable when there are NaN), or to float32 when no precision is lost. Defaults to True.
+            - n_jobs (int, optional): Number of threads the columns are parsed across, -1 for all cores (-2 for all cores but one, ...). Defaults to 1.
+            - verbose (bool, optional): Print the number of failed values and a sample of them per column. Defaults to True.
+            - return_report (bool, optional): Whether to also return the per-column parse report. Defaults to False.
 
         Returns:
             pd.DataFrame: DataFrame with specified columns converted to numeric type.
+            (pd.DataFrame, pd.DataFrame): When return_report=True, the DataFrame & a report indexed by column with the 'dtype', the number of 'failures' and a few failed 'samples'
         
         Example usage: 
         --------------
@@ -84,7 +692,7 @@ class TextTypos:
             import CleanData
 
             # Create a DataFrame
-            s1 = pd.DataFrame(np.arange(1, 20, 1))
+            s1 = pd.DataFrame(np.arange(1, 20, 1)).astype(object)
 
             # Enforce string values in the DataFrame columns 
             s1.iloc[15] = 'test'
@@ -96,9 +704,29 @@ class TextTypos:
             s1
         """       
 
-        for col in df[features].columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        return df[col]
+        if thousands is not None and thousands == decimal:
+            raise ValueError("Invalid value for thousands/decimal. Please provide two different separators.")
+        if features is None:
+            features = [col for col, values in df.items() if _is_text(values)]
+        n_workers = _n_workers(n_jobs, len(features))
+
+        def parse(col):
+            return _parse_numeric(df[col], thousands, decimal, downcast)
+
+        # String kernels & parsing release the GIL for arrow-backed strings, so threads avoid copying the columns
+        if n_workers > 1:
+            with ThreadPoolExecutor(n_workers) as pool:
+                results = list(pool.map(parse, features))
+        else:
+            results = [parse(col) for col in features]
+
+        report = pd.DataFrame(index=pd.Index(features, name='column'), columns=['dtype', 'failures', 'samples'], dtype=object)
+        for col, (numbers, n_failed, samples) in zip(features, results):
+            df[col] = numbers
+            report.loc[col] = [numbers.dtype, n_failed, samples]
+            if verbose and n_failed:
+                print(f"{col}: {n_failed:,} values couldn't be parsed, e.g. {samples}")
+        return (df, report) if return_report else df
     
     
     
@@ -106,15 +734,31 @@ class TextTypos:
     #* (3) Method 
     @classmethod
     @get_time
-    def correct_word(cls, df: pd.DataFrame, column: str) -> pd.DataFrame: 
+    def correct_word(cls, df: pd.DataFrame, column: str, language: str = 'en', distance: int = 2,
+                     backend='pyspellchecker', cache: CorrectionCache = None, n_jobs: int = 1,
+                     verbose: bool = True, return_report: bool = False) -> pd.DataFrame:
         """Correct spelling of a word using SpellChecker.
 
+        Each unique word is corrected once (repeated words are looked up in the
+        LRU cache shared across calls & columns) and the corrections are
+        broadcast back to the rows with the factorized codes, a category column
+        having its categories corrected & staying a category column. Dictionary words,
+        numbers, punctuation & words with digits skip the spell checker.
+
         Parameters:
             - df (pd.DataFrame): A pandas DataFrame.
             - Column (str): Input word to be corrected.
+            - language (str, optional): SpellChecker dictionary language. Defaults to 'en'.
+            - distance (int, optional): Maximum edit distance of the candidate corrections. Defaults to 2.
+            - backend (str or SymSpellIndex, optional): Correction engine, 'pyspellchecker', 'symspell' (symmetric delete index of the same dictionary) or a SymSpellIndex of a custom vocabulary. Defaults to 'pyspellchecker'.
+            - cache (CorrectionCache, optional): Cache of corrections to use. Defaults to None (TextTypos.cache).
+            - n_jobs (int, optional): Number of processes the uncached unique tokens are split across with the 'pyspellchecker' backend, -1 for all cores. Defaults to 1.
+            - verbose (bool, optional): Print the fraction of tokens that needed correction, and the progress & per-worker timing of a parallel correction. Defaults to True.
+            - return_report (bool, optional): Whether to also return the correction report. Defaults to False.
 
         Returns:
             str: Corrected version of the input word.
+            (pd.DataFrame, dict): When return_report=True, the corrected DataFrame & a report with the number of 'tokens', 'unique_tokens', 'unique_to_correct' and the 'needed_correction' fraction of tokens
         
         Example usage:
         ---------------
@@ -168,23 +812,52 @@ class TextTypos:
             corrected_df
 
         """    
-        spell = SpellChecker()
-        correct_words = [spell.correction(word) for word in df[column].values]
-        return pd.DataFrame(correct_words, columns=[column])
+        cache = cls.cache if cache is None else cache
+        index = _resolve_backend(backend, language, distance)
+        values = df[column]
+        codes, uniques = _factorize_text(values, max_fraction=1.0)
+        if codes is None:
+            # Unhashable values (lists, dicts, ...): only the strings are corrected, the other values are kept as they are
+            codes, uniques = _factorize_text(values.map(lambda value: value if isinstance(value, str) else None), max_fraction=1.0)
+        corrections, unknown = _correct_tokens(uniques.to_numpy(dtype=object), cache, language, distance, n_jobs, verbose,
+                                               index)
+        report = _correction_report(codes, unknown, verbose)
+        corrected = _corrected_frame(values, codes, corrections)
+        return (corrected, report) if return_report else corrected
     
     
     #* (4) Method 
     @classmethod
     @get_time
-    def correct_sentence(cls, df: pd.DataFrame, column: str) -> pd.DataFrame:
+    def correct_sentence(cls, df: pd.DataFrame, column: str, language: str = 'en', distance: int = 2,
+                         backend='pyspellchecker', cache: CorrectionCache = None, n_jobs: int = 1,
+                         verbose: bool = True, return_report: bool = False) -> pd.DataFrame:
         """Correct spelling in a sentence using SpellChecker.
 
+        The sentences are split into one long array of tokens (with pyarrow when
+        it is installed) and the punctuation & casing of each unique token are
+        set aside, so 'Dog.' and 'dog' share the correction of 'dog'. Each unique
+        word is corrected once (repeated words are looked up in the LRU cache
+        shared across calls & columns), dictionary words, numbers & words with
+        digits skip the spell checker, and words without any correction are
+        kept as they are. The sentences are then joined back with the token
+        offsets of each row. Category & low-cardinality columns only have
+        their unique sentences split & joined.
+
         Parameters:
             - df (pd.DataFrame): A pandas DataFrame.
             - Column (str): Input sentence to be corrected.
+            - language (str, optional): SpellChecker dictionary language. Defaults to 'en'.
+            - distance (int, optional): Maximum edit distance of the candidate corrections. Defaults to 2.
+            - backend (str or SymSpellIndex, optional): Correction engine, 'pyspellchecker', 'symspell' (symmetric delete index of the same dictionary) or a SymSpellIndex of a custom vocabulary. Defaults to 'pyspellchecker'.
+            - cache (CorrectionCache, optional): Cache of corrections to use. Defaults to None (TextTypos.cache).
+            - n_jobs (int, optional): Number of processes the uncached unique tokens are split across with the 'pyspellchecker' backend, -1 for all cores. Defaults to 1.
+            - verbose (bool, optional): Print the fraction of tokens that needed correction, and the progress & per-worker timing of a parallel correction. Defaults to True.
+            - return_report (bool, optional): Whether to also return the correction report. Defaults to False.
 
         Returns:
             str: Corrected version of the input sentence.
+            (pd.DataFrame, dict): When return_report=True, the corrected DataFrame & a report with the number of 'tokens', 'unique_tokens', 'unique_to_correct' and the 'needed_correction' fraction of tokens
         
         Example usage:
         ---------------
@@ -218,20 +891,38 @@ class TextTypos:
 
             corrected_df
         """     
-        # Create a SpellChecker object outside the loop
-        spell = SpellChecker()
-
-        # List to hold corrected sentences
-        corrected_sentences = []
-
-        # Iterate over each value in the DataFrame column
-        for sentence in df[column].str.split(' '):
-            # Use map to apply spell.correction to each word in the list
-            corrected_words = map(spell.correction, sentence)
-            # Join the corrected words to form a corrected sentence
-            corrected_sentence = ' '.join(corrected_words)
-            # Append the corrected sentence to the list
-            corrected_sentences.append(corrected_sentence)
-
-        # Create a DataFrame from the list of corrected sentences
-        return pd.DataFrame(corrected_sentences, columns=[column])
\ No newline at end of file
+        cache = cls.cache if cache is None else cache
+        index = _resolve_backend(backend, language, distance)
+        sentences = df[column]
+
+        # Category & low-cardinality columns only have their unique sentences corrected
+        row_codes, uniques = _factorize_text(sentences)
+        if row_codes is not None:
+            sentences = uniques
+        present = sentences.notna().to_numpy()
+
+        # One long array of tokens, the sentence boundaries are kept as offsets
+        codes, tokens, offsets = _split_sentences(sentences[present])
+        weights = None
+        if row_codes is not None:
+            counts = np.bincount(row_codes[row_codes >= 0], minlength=len(uniques))
+            weights = np.repeat(counts[present], np.diff(offsets))
+
+        # Only the lowercase core of the tokens is corrected, punctuation & casing are put back afterwards
+        leads, cores, trails = _split_punctuation(tokens)
+        core_codes, core_uniques = pd.factorize(np.array([core.lower() for core in cores], dtype=object))
+        corrections, unknown = _correct_tokens(np.asarray(core_uniques, dtype=object), cache, language, distance, n_jobs,
+                                               verbose, index)
+        report = _correction_report(core_codes[codes], unknown, verbose, weights)
+        tokens = np.array([_restore_token(*parts) for parts in zip(leads, cores, trails, corrections[core_codes])],
+                          dtype=object)
+
+        # Join the corrected tokens back per sentence, missing sentences are kept as they are
+        corrected_sentences = sentences.to_numpy(dtype=object, copy=True)
+        if present.any():
+            corrected_sentences[present] = _join_sentences(codes, tokens, offsets)
+        if row_codes is None:
+            corrected = pd.DataFrame({column: corrected_sentences}, index=df.index)
+        else:
+            corrected = _corrected_frame(df[column], row_codes, corrected_sentences)
+        return (corrected, report) if return_report else corrected
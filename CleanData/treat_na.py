@@ -12,9 +12,144 @@ from ._utils import get_time
 
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
+# Edge case tokens treated as missing values on top of NA/NaN/None
+MISSING_VALUES = ['missing', 'null', '', 'empty']
+
+
+def _is_text(values: pd.Series) -> bool:
+    """Only object, string & category columns can hold edge case tokens."""
+    return values.dtype == object or isinstance(values.dtype, (pd.StringDtype, pd.CategoricalDtype))
+
+
+#!############################# # Missing value tokens registry # ##############################
+
+class SentinelRegistry:
+    """Registry of the edge case tokens (sentinels) treated as missing values by TreatNA.
+
+    The tokens are normalised & compiled once into a hashed set per column, and
+    each column is matched against its set in a single pass whatever the number
+    of tokens. With case-insensitive matching or whitespace stripping, only the
+    unique values of a column are normalised and the result is mapped back with
+    the factorized codes.
+
+    Parameters:
+        - tokens (iterable of str, optional): Tokens treated as missing in every column. Defaults to ['missing', 'null', '', 'empty'].
+        - case_sensitive (bool, optional): Match tokens with their exact case. Defaults to True ('NULL' is not 'null').
+        - strip (bool, optional): Strip leading/trailing whitespace from values before matching. Defaults to False.
+        - column_tokens (dict, optional): {column: tokens} overrides replacing the global tokens for specific columns. Defaults to None.
+
+    Tokens added or removed for a single column (``add(..., column=...)``) are kept
+    as changes applied on top of the global tokens (or of the column's override),
+    so global tokens registered later still reach that column.
+
+    Example usage:
+    --------------
+    .. code-block:: python
+
+        import CleanData
+
+        # Add your own tokens to the registry shared by every TreatNA method
+        CleanData.TreatNA.sentinels.add('N/A', '-')
+
+        # Or pass a dedicated registry to a single call
+        sentinels = CleanData.SentinelRegistry(case_sensitive=False, strip=True, column_tokens={'comment': ['n/a']})
+        CleanData.TreatNA.complete_case_na(data, sentinels=sentinels)
+    """
+    def __init__(self, tokens=MISSING_VALUES, case_sensitive=True, strip=False, column_tokens=None):
+        self.case_sensitive = case_sensitive
+        self.strip = strip
+        self._tokens = set(tokens)
+        self._column_tokens = {column: set(values) for column, values in (column_tokens or {}).items()}
+        # Per-column changes made with add/remove(column=...), applied on top of the base tokens
+        self._column_added, self._column_removed = {}, {}
+        self._compiled = {}
+
+    def __repr__(self) -> str:
+        columns = self._column_tokens.keys() | self._column_added.keys() | self._column_removed.keys()
+        return (f"SentinelRegistry(tokens={sorted(self._tokens)}, case_sensitive={self.case_sensitive}, "
+                f"strip={self.strip}, column_tokens={ {k: sorted(self._raw_tokens(k)) for k in columns} })")
+
+    def add(self, *tokens, column=None) -> 'SentinelRegistry':
+        """Register tokens globally, or for one column only (on top of the global tokens)."""
+        if column is None:
+            self._tokens.update(tokens)
+        else:
+            self._column_added.setdefault(column, set()).update(tokens)
+            self._column_removed.get(column, set()).difference_update(tokens)
+        self._compiled.clear()
+        return self
+
+    def remove(self, *tokens, column=None) -> 'SentinelRegistry':
+        """Unregister tokens globally, or for one column only."""
+        if column is None:
+            self._tokens.difference_update(tokens)
+        else:
+            self._column_removed.setdefault(column, set()).update(tokens)
+            self._column_added.get(column, set()).difference_update(tokens)
+        self._compiled.clear()
+        return self
+
+    def _raw_tokens(self, column) -> set:
+        """Tokens of a column before normalisation: its base tokens plus its own additions, minus its removals."""
+        base = self._column_tokens.get(column, self._tokens)
+        return (base | self._column_added.get(column, set())) - self._column_removed.get(column, set())
+
+    def tokens(self, column=None) -> frozenset:
+        """Return the compiled (normalised) token set matched against a column."""
+        customised = column in self._column_tokens or column in self._column_added or column in self._column_removed
+        key = column if customised else None
+        if key not in self._compiled:
+            raw = self._raw_tokens(key) if key is not None else self._tokens
+            self._compiled[key] = frozenset(self._normalise(token) for token in raw)
+        return self._compiled[key]
+
+    def _normalise(self, token: str) -> str:
+        if self.strip:
+            token = token.strip()
+        if not self.case_sensitive:
+            token = token.lower()
+        return token
+
+    def mask(self, values: pd.Series, column=None) -> np.ndarray:
+        """Boolean array flagging the values of a column that are registered tokens."""
+        tokens = self.tokens(column)
+        if not tokens or not _is_text(values):
+            return np.zeros(len(values), dtype=bool)
+        if self.case_sensitive and not self.strip:
+            return values.isin(tokens).to_numpy(dtype=bool, na_value=False)
+
+        # Normalise the unique values only, then broadcast the matches back with the codes
+        codes, uniques = pd.factorize(values)
+        normalised = pd.Series(uniques, dtype=object)
+        if self.strip:
+            normalised = normalised.str.strip()
+        if not self.case_sensitive:
+            normalised = normalised.str.lower()
+        hits = np.append(normalised.isin(tokens).to_numpy(), False)  # codes == -1 (NA) land on the trailing False
+        return hits[codes]
+
+
+def _missing_mask(data: pd.DataFrame, sentinels: SentinelRegistry) -> pd.Series:
+    """Build a boolean row mask flagging rows that contain at least one missing value.
+
+    The mask is built column-wise: every column contributes ``isna()``, and only
+    text-like columns (object, string & category) are matched against the
+    sentinel tokens - numeric, boolean & datetime columns can't hold them.
+    The per-column masks are OR-ed together into a single row mask.
+    """
+    mask = np.zeros(len(data), dtype=bool)
+    # items() rather than data[col] so duplicated column names are handled one at a time
+    for column, values in data.items():
+        mask |= values.isna().to_numpy()
+        mask |= sentinels.mask(values, column)
+    return pd.Series(mask, index=data.index)
+
 #!############################# # Treating NA values subclass # ##############################
 
 class TreatNA:
+    # Edge case tokens shared by IdentifyNAs, complete_case_na & drop_complete_case_na
+    sentinels = SentinelRegistry()
+
     def __init__(self, data):
         self.data = data
 
@@ -22,11 +157,12 @@ class TreatNA:
     #* (1) Method 
     @classmethod
     @get_time
-    def IdentifyNAs(cls, data: pd.DataFrame) -> pd.DataFrame:
+    def IdentifyNAs(cls, data: pd.DataFrame, sentinels: SentinelRegistry = None) -> pd.DataFrame:
         """Identify rows containing missing values in a DataFrame.
 
         Parameters:
             - data (pd.DataFrame): Input DataFrame to search for missing values.
+            - sentinels (SentinelRegistry, optional): Edge case tokens treated as missing. Defaults to None (TreatNA.sentinels).
 
         Returns:
             pd.DataFrame: DataFrame containing rows with missing values.
@@ -47,10 +183,8 @@ class TreatNA:
 
             CleanData.TreatNA.IdentifyNAs(data)
         """       
-        missing_values = [np.nan, 'missing', 'null', '', 'empty']
         # Find rows containing any of the missing values
-        mask = data.apply(lambda row: any(str(val) in missing_values for val in row), axis=1)
-        return data[mask]
+        return data[_missing_mask(data, sentinels or cls.sentinels)]
 
     
     
@@ -59,12 +193,13 @@ class TreatNA:
     #* (2) Method
     @classmethod
     @get_time
-    def complete_case_na(cls, data: pd.DataFrame) -> pd.DataFrame:
+    def complete_case_na(cls, data: pd.DataFrame, sentinels: SentinelRegistry = None) -> pd.DataFrame:
         """
         Filter DataFrame to retain rows with complete case or edge case missing values.
 
         Parameters:
             - data (pd.DataFrame): Input DataFrame containing potentially incomplete rows.
+            - sentinels (SentinelRegistry, optional): Edge case tokens treated as missing. Defaults to None (TreatNA.sentinels).
 
         Returns:
             pd.DataFrame: DataFrame with rows containing complete case or edge case missing values.
@@ -90,11 +225,8 @@ class TreatNA:
             CleanData.TreatNA.complete_case_na(data)
 
         """     
-        # Include edge cases
-        missing_values = ['missing', 'null', '', 'empty']
-
         # Filter the data to return CCA with edge cases
-        return data[data.apply(lambda row: any(pd.isna(val) or str(val) in missing_values for val in row), axis=1)]
+        return data[_missing_mask(data, sentinels or cls.sentinels)]
 
     
     
@@ -103,12 +235,13 @@ class TreatNA:
     #* (3) Method 
     @classmethod
     @get_time
-    def drop_complete_case_na(cls, data: pd.DataFrame) -> pd.DataFrame:
+    def drop_complete_case_na(cls, data: pd.DataFrame, sentinels: SentinelRegistry = None) -> pd.DataFrame:
         """
         Drop rows with complete case missing values from a DataFrame.
 
         Parameters:
             - data : pd.DataFrame Input DataFrame containing potentially incomplete rows.
+            - sentinels (SentinelRegistry, optional): Edge case tokens treated as missing. Defaults to None (TreatNA.sentinels).
 
         Returns: 
             pd.DataFrame with complete case rows retained.
@@ -148,12 +281,8 @@ class TreatNA:
             print(cleaned_data)
 
         """
-        # Identify rows to drop and return the corresponding index value
-        missing_values = ['missing', 'null', '', 'empty']
-        rows_to_drop = data[data.apply(lambda row: any(pd.isna(val) or str(val) in missing_values for val in row), axis=1)].index
-
-        # Drop rows
-        cleaned_data = data.drop(index=rows_to_drop)
+        # Keep only the rows without any missing value (positional mask, so duplicated index labels are safe)
+        cleaned_data = data[~_missing_mask(data, sentinels or cls.sentinels)]
         return cleaned_data
     
     
@@ -0,0 +1,84 @@
+"""Local outlier factor at scale: exact LocalOutlierFactor vs the scalable (capped k, tree search, blockwise) mode.
+
+Gaussian clusters get a few shifted outliers. The exact mode keeps the legacy
+neighbourhood of ``len(data) * neighbors_fraction`` rows, so it is quadratic
+in the number of rows: it only runs up to ``--exact-max-rows`` and is
+extrapolated quadratically beyond. The scalable mode caps the neighbourhood
+at ``--max-neighbors`` and reports the recall of its outliers against an exact
+LocalOutlierFactor (with the same k) on a sample of rows. The novelty mode fits
+on a stratified sample of ``--sample-size`` rows and scores every row in
+batches across ``--n-jobs`` processes.
+
+Usage:
+    python benchmarks/bench_anomalies.py [--rows 10000 100000 1000000] [--features 5] [--exact-max-rows 20000]
+                                         [--max-neighbors 50] [--algorithm auto] [--sample-size 100000]
+                                         [--n-jobs 1]
+"""
+import argparse
+import contextlib
+import io
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from CleanData import Anomalies  # noqa: E402
+
+
+def make_frame(n_rows: int, n_features: int, n_clusters: int = 5, outlier_fraction: float = 0.001, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-10, 10, size=(n_clusters, n_features))
+    X = centers[rng.integers(n_clusters, size=n_rows)] + rng.normal(size=(n_rows, n_features))
+    outliers = rng.choice(n_rows, max(1, int(n_rows * outlier_fraction)), replace=False)
+    X[outliers] += rng.uniform(6, 12, size=(len(outliers), n_features)) * rng.choice([-1, 1], size=(len(outliers), n_features))
+    return pd.DataFrame(X, columns=[f'f{i}' for i in range(n_features)])
+
+
+def timed(func, *args, **kwargs):
+    start = perf_counter()
+    # Silence the get_time decorator & the elapsed time prints so only the benchmark table is printed
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args, **kwargs)
+    return result, perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--features', type=int, default=5)
+    parser.add_argument('--exact-max-rows', type=int, default=20_000)
+    parser.add_argument('--max-neighbors', type=int, default=50)
+    parser.add_argument('--algorithm', default='auto', choices=['auto', 'kd_tree', 'ball_tree', 'approximate'])
+    parser.add_argument('--sample-size', type=int, default=100_000)
+    parser.add_argument('--n-jobs', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'exact k':>8} {'exact (s)':>10} {'scalable k':>10} {'scalable (s)':>12} {'recall':>7} {'speed-up':>9} {'novelty (s)':>11}")
+    exact_rows = exact_time = None
+    for n_rows in args.rows:
+        df = make_frame(n_rows, args.features)
+        features = df.columns.to_list()
+        exact_k = max(1, int(n_rows * 0.1))
+        if n_rows <= args.exact_max_rows:
+            _, exact_time = timed(Anomalies.nonlinear_outliers_influencers_knn, df, features, n_jobs=args.n_jobs)
+            exact_rows, exact, estimated = n_rows, exact_time, ''
+        elif exact_rows is not None:
+            exact, estimated = exact_time * (n_rows / exact_rows) ** 2, '~'
+        else:
+            exact, estimated = float('nan'), ''
+
+        (_, report), scalable = timed(Anomalies.nonlinear_outliers_influencers_knn, df, features, method='scalable',
+                                      max_neighbors=args.max_neighbors, algorithm=args.algorithm, n_jobs=args.n_jobs,
+                                      return_report=True)
+        _, novelty = timed(Anomalies.nonlinear_outliers_influencers_knn, df, features, method='novelty',
+                           max_neighbors=args.max_neighbors, sample_size=args.sample_size, n_jobs=args.n_jobs)
+        print(f"{n_rows:>10,} {exact_k:>8,} {estimated + format(exact, '.2f'):>10} {report['n_neighbors']:>10,} "
+              f"{scalable:>12.2f} {report['recall']:>7.1%} {estimated + format(exact / scalable, '.0f') + 'x':>9} {novelty:>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
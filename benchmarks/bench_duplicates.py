@@ -0,0 +1,69 @@
+"""Duplicate detection on a large, wide frame: DataFrame.duplicated vs 64-bit row hashes.
+
+Each method runs in a fresh interpreter that builds the same frame (half numeric,
+half text columns), resets its peak RSS counter (Linux /proc/self/clear_refs) and
+reports the time and the extra peak memory (VmHWM minus the RSS once the frame is
+built) of FindTreatDuplicates.find_duplicates.
+
+Usage:
+    python benchmarks/bench_duplicates.py [--rows 5000000] [--cols 40]
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+METHODS = {
+    'exact (DataFrame.duplicated)': "method='exact'",
+    'hash + verify collisions': "method='hash', verify=True",
+    'hash only': "method='hash', verify=False",
+}
+
+PROBE = '''
+import contextlib, io, time
+import numpy as np
+import pandas as pd
+import CleanData
+
+def status(key):
+    return next(int(line.split()[1]) for line in open('/proc/self/status') if line.startswith(key)) / 1024
+
+rng = np.random.default_rng(0)
+n_rows, n_cols = {rows}, {cols}
+base = n_rows * 9 // 10
+columns = {{}}
+for i in range(n_cols):
+    values = rng.integers(0, 1_000, base) if i % 2 else rng.choice(['alpha', 'beta', 'gamma', 'delta', 'epsilon'], base).astype(object)
+    columns[f'c{{i}}'] = np.concatenate([values, values[:n_rows - base]])  # last 10% duplicate the first rows
+data = pd.DataFrame(columns)
+del columns
+
+with open('/proc/self/clear_refs', 'w') as f:
+    f.write('5')  # reset VmHWM so building the frame doesn't count
+before = status('VmRSS')
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    duplicates = CleanData.FindTreatDuplicates.find_duplicates(data, {kwargs})
+elapsed = time.perf_counter() - start
+print(elapsed, status('VmHWM') - before, len(duplicates))
+'''
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5_000_000)
+    parser.add_argument('--cols', type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{'method':<30}{'time (s)':>10}{'extra peak (MB)':>18}{'duplicates':>12}")
+    for label, kwargs in METHODS.items():
+        probe = PROBE.format(rows=args.rows, cols=args.cols, kwargs=kwargs)
+        out = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, capture_output=True, text=True, check=True)
+        elapsed, peak, n_duplicates = out.stdout.split()
+        print(f"{label:<30}{float(elapsed):>10.2f}{float(peak):>18.1f}{int(n_duplicates):>12,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Cold import cost of the CleanData package.
+
+Every scenario runs in a fresh interpreter so nothing is cached between runs.
+The 'eager' scenario imports every submodule, which is what `import CleanData`
+used to do before the subclasses were exposed lazily.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 5]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SCENARIOS = {
+    'import CleanData': 'import CleanData',
+    'CleanData.Memory': 'import CleanData; CleanData.Memory',
+    'eager (all submodules)': (
+        'import CleanData\n'
+        'for name in ("memory", "treat_na", "find_treat_duplicates", "text_typos", "anomalies", "qa"):\n'
+        '    try:\n'
+        '        getattr(CleanData, name)\n'
+        '    except ImportError as e:\n'
+        '        print("skipped", name, e, file=sys.stderr)\n'
+    ),
+}
+
+PROBE = '''
+import resource, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(f"{{elapsed}} {{rss_mb}}")
+'''
+
+
+def run(code: str) -> tuple:
+    probe = PROBE.format(code=code)
+    out = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, capture_output=True, text=True, check=True)
+    elapsed, rss = out.stdout.split()
+    return float(elapsed), float(rss)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<26}{'median import (s)':>20}{'peak RSS (MB)':>16}")
+    for label, code in SCENARIOS.items():
+        runs = [run(code) for _ in range(args.repeat)]
+        print(f"{label:<26}{statistics.median(r[0] for r in runs):>20.3f}{max(r[1] for r in runs):>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
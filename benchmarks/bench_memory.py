@@ -0,0 +1,73 @@
+"""Peak memory of a naive load + optimise_mem vs the two-pass Memory.optimise_mem_chunked.
+
+A CSV file is generated once, then each loader runs in a fresh interpreter and
+reports its peak RSS (VmHWM on Linux: ru_maxrss would be inherited from this
+parent process through fork), so the numbers aren't polluted by other runs.
+
+Usage:
+    python benchmarks/bench_memory.py [--rows 5000000] [--chunksize 500000]
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+
+LOADERS = {
+    'naive read_csv + optimise_mem': 'data = CleanData.Memory.optimise_mem(pd.read_csv(path), verbose=False)',
+    'two-pass optimise_mem_chunked': 'data = CleanData.Memory.optimise_mem_chunked(path, chunksize=chunksize, verbose=False)',
+}
+
+PROBE = '''
+import contextlib, io, resource, sys, time
+import pandas as pd
+import CleanData
+path, chunksize = {path!r}, {chunksize}
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    {code}
+elapsed = time.perf_counter() - start
+try:
+    peak = next(int(line.split()[1]) for line in open('/proc/self/status') if line.startswith('VmHWM')) / 1024
+except OSError:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(elapsed, peak, data.memory_usage(deep=True).sum() / 1024 ** 2)
+'''
+
+
+def make_csv(path: Path, n_rows: int, seed: int = 0) -> None:
+    rng = np.random.default_rng(seed)
+    pd.DataFrame({
+        'id': np.arange(n_rows),
+        'age': rng.integers(18, 90, n_rows),
+        'amount': rng.normal(100, 15, n_rows).round(2),
+        'quantity': rng.integers(0, 1_000, n_rows),
+        'city': rng.choice(['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix'], n_rows),
+        'status': rng.choice(['active', 'inactive', 'pending'], n_rows),
+    }).to_csv(path, index=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5_000_000)
+    parser.add_argument('--chunksize', type=int, default=500_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'data.csv'
+        make_csv(path, args.rows)
+        print(f"{'loader':<32}{'time (s)':>10}{'peak RSS (MB)':>16}{'result (MB)':>14}")
+        for label, code in LOADERS.items():
+            probe = PROBE.format(path=str(path), chunksize=args.chunksize, code=code)
+            out = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, capture_output=True, text=True, check=True)
+            elapsed, peak, size = map(float, out.stdout.split())
+            print(f"{label:<32}{elapsed:>10.2f}{peak:>16.1f}{size:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
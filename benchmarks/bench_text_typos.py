@@ -0,0 +1,123 @@
+"""Spelling correction on skewed (Zipfian) tokens: per-row SpellChecker vs per-unique-token with a cache.
+
+The vocabulary mixes frequent English words with misspelled variants (one
+character dropped, doubled or swapped) and every row draws its tokens with
+Zipfian weights, so a few thousand distinct tokens are repeated over millions
+of rows. The legacy implementation (``spell.correction`` on every row / token)
+is re-created here, checked against ``TextTypos.correct_word`` and only run up
+to ``--legacy-max-rows``. The new path is timed cold (empty cache, the unique
+tokens split across ``--n-jobs`` processes) and warm. With ``--backend symspell``
+the new path uses the symmetric delete index (built before timing) instead of
+SpellChecker, so its results are compared with the legacy ones rather than
+asserted equal (frequency ties may be broken differently).
+
+Usage:
+    python benchmarks/bench_text_typos.py [--rows 100000 1000000] [--vocab 5000] [--legacy-max-rows 20000]
+                                          [--n-jobs 1] [--backend pyspellchecker]
+"""
+import argparse
+import contextlib
+import io
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from spellchecker import SpellChecker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from CleanData import TextTypos  # noqa: E402
+from CleanData.text_typos import _symspell_index  # noqa: E402
+
+
+def make_vocabulary(size: int, typo_fraction: float = 0.3, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    frequencies = SpellChecker().word_frequency.dictionary
+    words = [word for word in sorted(frequencies, key=frequencies.get, reverse=True) if len(word) > 3][:size]
+    vocabulary = []
+    for word in words:
+        if rng.random() < typo_fraction:
+            i = int(rng.integers(1, len(word) - 1))
+            kind = rng.integers(3)
+            if kind == 0:
+                word = word[:i] + word[i + 1:]
+            elif kind == 1:
+                word = word[:i] + word[i] + word[i:]
+            else:
+                word = word[:i - 1] + word[i] + word[i - 1] + word[i + 1:]
+        vocabulary.append(word)
+    return np.array(vocabulary, dtype=object)
+
+
+def make_frame(n_rows: int, vocabulary: np.ndarray, words_per_sentence: int = 8, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    # Zipfian ranks folded into the vocabulary
+    words = vocabulary[(rng.zipf(1.3, n_rows) - 1) % len(vocabulary)]
+    tokens = vocabulary[(rng.zipf(1.3, n_rows * words_per_sentence) - 1) % len(vocabulary)]
+    sentences = [' '.join(row) for row in tokens.reshape(n_rows, words_per_sentence)]
+    return pd.DataFrame({'word': words, 'sentence': sentences})
+
+
+def legacy_word(df: pd.DataFrame) -> list:
+    spell = SpellChecker()
+    return [spell.correction(word) for word in df['word'].values]
+
+
+def legacy_sentence(df: pd.DataFrame) -> list:
+    spell = SpellChecker()
+    return [' '.join(map(spell.correction, sentence)) for sentence in df['sentence'].str.split(' ')]
+
+
+def timed(func, *args, **kwargs):
+    start = perf_counter()
+    # Silence the get_time decorator so only the benchmark table is printed
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args, **kwargs)
+    return result, perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--vocab', type=int, default=5_000)
+    parser.add_argument('--legacy-max-rows', type=int, default=20_000)
+    parser.add_argument('--n-jobs', type=int, default=1)
+    parser.add_argument('--backend', choices=['pyspellchecker', 'symspell'], default='pyspellchecker')
+    args = parser.parse_args()
+
+    vocabulary = make_vocabulary(args.vocab)
+    if args.backend == 'symspell':
+        _, build_s = timed(_symspell_index, 'en', 2)
+        print(f'symspell index built in {build_s:.1f}s')
+    print(f"{'rows':>10}{'method':>17}{'unique':>9}{'legacy (s)':>12}{'cold (s)':>10}{'warm (s)':>10}{'speed-up':>10}")
+    for n_rows in args.rows:
+        data = make_frame(n_rows, vocabulary)
+        for label, method, legacy, column in (
+            ('correct_word', TextTypos.correct_word, legacy_word, 'word'),
+            ('correct_sentence', TextTypos.correct_sentence, legacy_sentence, 'sentence'),
+        ):
+            TextTypos.cache.clear()
+            new, cold_s = timed(method, data, column, backend=args.backend, n_jobs=args.n_jobs)
+            _, warm_s = timed(method, data, column, backend=args.backend, n_jobs=args.n_jobs)
+            n_unique = len(TextTypos.cache)
+            if n_rows <= args.legacy_max_rows:
+                old, old_s = timed(legacy, data)
+                agreement = np.mean([a == b for a, b in zip(old, new[column])])
+                if args.backend == 'pyspellchecker':
+                    assert agreement == 1, f'{label} disagrees with the legacy implementation'
+                else:
+                    print(f'{label}: {agreement:.2%} of the rows match the legacy corrections')
+                speed_up = f'{old_s / cold_s:.0f}x'
+            else:
+                # Extrapolate the per-row legacy cost measured on a slice
+                sample = data.iloc[:args.legacy_max_rows]
+                _, old_s = timed(legacy, sample)
+                old_s *= n_rows / len(sample)
+                speed_up = f'~{old_s / cold_s:.0f}x'
+            print(f"{n_rows:>10,}{label:>17}{n_unique:>9,}{old_s:>12.1f}{cold_s:>10.2f}{warm_s:>10.2f}{speed_up:>10}")
+
+
+if __name__ == '__main__':
+    main()
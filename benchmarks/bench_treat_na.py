@@ -0,0 +1,70 @@
+"""Missing-value detection: row-wise apply vs the column-wise TreatNA engine.
+
+The legacy implementation is re-created here (``data.apply(..., axis=1)`` with
+``str(val)`` per cell) and checked against ``TreatNA.complete_case_na``.
+It is only run up to ``--legacy-max-rows`` because it takes minutes beyond that.
+
+Usage:
+    python benchmarks/bench_treat_na.py [--rows 1000000 10000000] [--legacy-max-rows 1000000]
+"""
+import argparse
+import contextlib
+import io
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from CleanData import TreatNA  # noqa: E402
+
+MISSING_VALUES = ['missing', 'null', '', 'empty']
+
+
+def make_frame(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    floats = rng.random(n_rows)
+    floats[rng.random(n_rows) < 0.01] = np.nan
+    return pd.DataFrame({
+        'id': np.arange(n_rows),
+        'value': floats,
+        'city': rng.choice(['New York', 'Chicago', 'Houston', 'null', ''], n_rows, p=[0.3, 0.3, 0.38, 0.01, 0.01]),
+        'status': rng.choice(['active', 'inactive', 'missing', 'empty'], n_rows, p=[0.5, 0.48, 0.01, 0.01]),
+    })
+
+
+def legacy(data: pd.DataFrame) -> pd.DataFrame:
+    return data[data.apply(lambda row: any(pd.isna(val) or str(val) in MISSING_VALUES for val in row), axis=1)]
+
+
+def timed(func, *args):
+    start = perf_counter()
+    # Silence the get_time decorator so only the benchmark table is printed
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    return result, perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    parser.add_argument('--legacy-max-rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>12}{'legacy apply (s)':>18}{'column-wise (s)':>17}{'speed-up':>10}")
+    for n_rows in args.rows:
+        data = make_frame(n_rows)
+        new, new_s = timed(TreatNA.complete_case_na, data)
+        if n_rows <= args.legacy_max_rows:
+            old, old_s = timed(legacy, data)
+            assert old.equals(new), 'column-wise engine disagrees with the legacy implementation'
+            print(f"{n_rows:>12,}{old_s:>18.3f}{new_s:>17.3f}{old_s / new_s:>9.0f}x")
+        else:
+            print(f"{n_rows:>12,}{'skipped':>18}{new_s:>17.3f}{'-':>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from CleanData import Memory
+
+
+def test_optimise_mem_leaves_complex_columns_alone():
+    data = pd.DataFrame({'c': [1 + 2j, 3 + 4j], 'n': [1, 2]})
+    optimised = Memory.optimise_mem(data, verbose=False)
+    assert optimised['c'].dtype == np.complex128
+    assert optimised['c'].tolist() == [1 + 2j, 3 + 4j]
+    assert optimised['n'].dtype == np.uint8
+
+
+def test_plan_rejects_casting_complex_columns_to_real_dtypes():
+    data = pd.DataFrame({'c': [1 + 2j, 3 + 4j]})
+    plan = {'version': 1, 'columns': [{'name': 'c', 'dtype': 'float32'}]}
+    with pytest.raises(ValueError, match='complex'):
+        Memory.optimise_mem(data, plan=plan, verbose=False)
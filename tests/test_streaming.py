@@ -0,0 +1,16 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from CleanData import StreamingOutliers
+
+
+@pytest.mark.parametrize('method', ['zscore', 'mad', 'iqr'])
+def test_serial_and_parallel_fits_flag_the_same_rows(method):
+    rng = np.random.default_rng(0)
+    chunks = [pd.DataFrame({'a': rng.standard_t(3, 5_000), 'b': rng.exponential(size=5_000)}) for _ in range(6)]
+    serial = StreamingOutliers(method=method).fit(chunks, n_jobs=1)
+    parallel = StreamingOutliers(method=method).fit(chunks, n_jobs=2)
+    pd.testing.assert_frame_equal(serial.bounds(), parallel.bounds())
+    for chunk in chunks:
+        pd.testing.assert_frame_equal(serial.flag(chunk), parallel.flag(chunk))